@@ -8,6 +8,8 @@ from narrator.agents.intent import (
     IntentValidationError,
     load_action_whitelist,
     validate_intent,
+    validate_intent_trusted,
+    validate_intents,
 )
 from narrator.agents.retry import (
     FallbackInput,
@@ -34,4 +36,6 @@ __all__ = [
     "SettlementContext",
     "load_action_whitelist",
     "validate_intent",
+    "validate_intent_trusted",
+    "validate_intents",
 ]
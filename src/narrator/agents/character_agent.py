@@ -10,7 +10,7 @@ from pydantic import BaseModel
 from narrator.agents.intent import (
     ActionWhitelist,
     IntentPayload,
-    validate_intent,
+    validate_intent_trusted,
 )
 from narrator.knowledge import CharacterKnowledgeContext
 from narrator.llm.base import LLMRequest
@@ -56,7 +56,7 @@ class CharacterAgent:
             IntentResponse,
             provider_name=self._provider_name,
         )
-        return validate_intent(self._to_payload(character.id, response), self._whitelist)
+        return validate_intent_trusted(self._to_payload(character.id, response), self._whitelist)
 
     def _build_request(
         self,
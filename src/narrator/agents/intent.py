@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import Field, ValidationError, model_validator
+from pydantic import Field, TypeAdapter, ValidationError, model_validator
 
-from narrator.models.base import DomainModel
+from narrator.file_cache import FileFingerprint, cache_lookup, cache_store, file_fingerprint
+from narrator.models.base import DomainModel, construct_trusted
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings unavailable
+    from yaml import SafeLoader as _YamlLoader
+
+TRUSTED_TEXT_FIELDS = ("character_id", "action_type", "flavor_text")
 
 
 class IntentValidationError(RuntimeError):
@@ -19,9 +31,24 @@ class ActionRule(DomainModel):
     required_params: tuple[str, ...] = ()
     optional_params: tuple[str, ...] = ()
 
+    @cached_property
+    def required_set(self) -> frozenset[str]:
+        return frozenset(self.required_params)
+
+    @cached_property
+    def allowed_set(self) -> frozenset[str]:
+        return self.required_set.union(self.optional_params)
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> "ActionRule":
+        copied = super().model_copy(update=update, deep=deep)
+        # The copy inherits __dict__, so drop param sets cached from the original fields.
+        copied.__dict__.pop("required_set", None)
+        copied.__dict__.pop("allowed_set", None)
+        return copied
+
     @model_validator(mode="after")
     def validate_param_overlap(self) -> "ActionRule":
-        overlap = set(self.required_params) & set(self.optional_params)
+        overlap = self.required_set.intersection(self.optional_params)
         if overlap:
             dup = ",".join(sorted(overlap))
             raise ValueError(f"duplicated params in rule: {dup}")
@@ -41,27 +68,108 @@ class IntentPayload(DomainModel):
     flavor_text: str = Field(..., min_length=1)
 
 
+_WHITELIST_ADAPTER: TypeAdapter[ActionWhitelist] = TypeAdapter(ActionWhitelist)
+_INTENT_LIST_ADAPTER: TypeAdapter[list[IntentPayload]] = TypeAdapter(list[IntentPayload])
+_WHITELIST_CACHE: OrderedDict[str, tuple[FileFingerprint, ActionWhitelist]] = OrderedDict()
+_TRUSTED_PAYLOADS: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+
+def clear_whitelist_cache() -> None:
+    _WHITELIST_CACHE.clear()
+    _TRUSTED_PAYLOADS.clear()
+
+
 def load_action_whitelist(path: str | Path = "config/schemas/action_whitelist.yaml") -> ActionWhitelist:
+    """Load the whitelist, reusing the cached instance while the file is unchanged.
+
+    The returned whitelist is shared between callers: treat ``actions`` as read-only.
+    """
     file_path = Path(path)
     if not file_path.exists():
         raise IntentValidationError(f"action whitelist file not found: {file_path}")
+    fingerprint = file_fingerprint(file_path)
+    cached = cache_lookup(_WHITELIST_CACHE, fingerprint[0], fingerprint)
+    if cached is not None:
+        return cached
+    whitelist = _load_action_whitelist_uncached(file_path)
+    cache_store(_WHITELIST_CACHE, fingerprint[0], (fingerprint, whitelist))
+    return whitelist
+
+
+def _load_action_whitelist_uncached(file_path: Path) -> ActionWhitelist:
+    raw_bytes = file_path.read_bytes()
+    digest = hashlib.sha256(raw_bytes).hexdigest()
+    trusted = _TRUSTED_PAYLOADS.get(digest)
+    if trusted is not None:
+        _TRUSTED_PAYLOADS.move_to_end(digest)
+        return construct_trusted(ActionWhitelist, trusted)
+
     try:
-        raw = yaml.safe_load(file_path.read_text(encoding="utf-8"))
+        raw = yaml.load(raw_bytes.decode("utf-8"), Loader=_YamlLoader)
     except yaml.YAMLError as exc:
         raise IntentValidationError(f"invalid action whitelist yaml: {file_path}") from exc
     try:
-        return ActionWhitelist.model_validate(raw)
+        whitelist = _WHITELIST_ADAPTER.validate_python(raw)
     except ValidationError as exc:
         raise IntentValidationError("action whitelist validation failed") from exc
+    cache_store(_TRUSTED_PAYLOADS, digest, whitelist.model_dump())
+    return whitelist
 
 
 def validate_intent(payload: IntentPayload | dict[str, Any], whitelist: ActionWhitelist) -> IntentPayload:
     intent = _parse_intent(payload)
-    rule = whitelist.actions.get(intent.action_type)
+    _check_whitelist(intent, whitelist.actions)
+    return intent
+
+
+def validate_intent_trusted(payload: dict[str, Any], whitelist: ActionWhitelist) -> IntentPayload:
+    """Validate an intent assembled internally from already-typed fields.
+
+    Only the IntentPayload constraints are re-checked by hand before
+    ``model_construct``; external input should go through ``validate_intent``.
+    """
+    intent = _construct_trusted_intent(payload)
+    _check_whitelist(intent, whitelist.actions)
+    return intent
+
+
+def validate_intents(
+    payloads: Sequence[IntentPayload | dict[str, Any]],
+    whitelist: ActionWhitelist,
+) -> list[IntentPayload]:
+    """Validate a batch of intents with one pydantic call, preserving order."""
+    try:
+        intents = _INTENT_LIST_ADAPTER.validate_python(payloads)
+    except ValidationError as exc:
+        raise IntentValidationError("intent payload validation failed") from exc
+    actions = whitelist.actions
+    for intent in intents:
+        _check_whitelist(intent, actions)
+    return intents
+
+
+def _check_whitelist(intent: IntentPayload, actions: dict[str, ActionRule]) -> None:
+    rule = actions.get(intent.action_type)
     if rule is None:
         raise IntentValidationError(f"action not allowed: {intent.action_type}")
     _validate_parameters(intent.parameters, rule)
-    return intent
+
+
+def _construct_trusted_intent(payload: dict[str, Any]) -> IntentPayload:
+    unknown = payload.keys() - IntentPayload.model_fields.keys()
+    if unknown:
+        names = ",".join(sorted(unknown))
+        raise IntentValidationError(f"intent payload validation failed: unknown fields {names}")
+    for field_name in TRUSTED_TEXT_FIELDS:
+        value = payload.get(field_name)
+        if not isinstance(value, str) or not value:
+            raise IntentValidationError(f"intent payload validation failed: {field_name}")
+    if not isinstance(payload.get("parameters", {}), dict):
+        raise IntentValidationError("intent payload validation failed: parameters")
+    target_id = payload.get("target_id")
+    if target_id is not None and not isinstance(target_id, str):
+        raise IntentValidationError("intent payload validation failed: target_id")
+    return IntentPayload.model_construct(**payload)
 
 
 def _parse_intent(payload: IntentPayload | dict[str, Any]) -> IntentPayload:
@@ -74,12 +182,8 @@ def _parse_intent(payload: IntentPayload | dict[str, Any]) -> IntentPayload:
 
 
 def _validate_parameters(parameters: dict[str, Any], rule: ActionRule) -> None:
-    keys = set(parameters.keys())
-    required = set(rule.required_params)
-    optional = set(rule.optional_params)
-    allowed = required | optional
-    missing = required - keys
-    unknown = keys - allowed
+    missing = rule.required_set.difference(parameters)
+    unknown = parameters.keys() - rule.allowed_set
     if missing:
         names = ",".join(sorted(missing))
         raise IntentValidationError(f"missing required parameters: {names}")
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import re
+import string
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Literal
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, model_validator
 
-ENV_PATTERN = re.compile(r"\$\{([A-Z0-9_]+)\}")
+from narrator.file_cache import FileFingerprint, cache_lookup, cache_store, file_fingerprint
+from narrator.models.base import construct_trusted
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml bindings unavailable
+    from yaml import SafeLoader as _YamlLoader
+
+ENV_TOKEN_OPEN = "${"
+ENV_TOKEN_CLOSE = "}"
+ENV_NAME_CHARS = frozenset(string.ascii_uppercase + string.digits + "_")
 ENV_LINE_PATTERN = re.compile(r"^\s*([A-Z0-9_]+)\s*=\s*(.*)\s*$")
 DEFAULT_ENV_PATH = Path(".env")
 
@@ -25,6 +39,7 @@ class StrictModel(BaseModel):
         extra="forbid",
         frozen=True,
         protected_namespaces=(),
+        defer_build=True,
     )
 
 
@@ -60,7 +75,7 @@ class SpotlightConfig(StrictModel):
 
 
 class PhenologyConfig(StrictModel):
-    enabled_effects: list[str] = Field(..., min_length=1)
+    enabled_effects: tuple[str, ...] = Field(..., min_length=1)
 
 
 class OpenAIProviderConfig(StrictModel):
@@ -68,6 +83,7 @@ class OpenAIProviderConfig(StrictModel):
     api_key: str = Field(..., min_length=1)
     base_url: str = Field(..., min_length=1)
     max_tokens: int = Field(..., gt=0)
+    supports_batch_prompts: bool = False
 
 
 class AnthropicProviderConfig(StrictModel):
@@ -106,6 +122,18 @@ class AppConfig(StrictModel):
     persistence: PersistenceConfig
 
 
+_APP_CONFIG_ADAPTER: TypeAdapter[AppConfig] = TypeAdapter(AppConfig)
+_CONFIG_CACHE: OrderedDict[tuple[str, str], tuple[tuple[FileFingerprint, FileFingerprint], AppConfig]] = OrderedDict()
+_TRUSTED_PAYLOADS: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_YAML_CACHE: OrderedDict[str, tuple[FileFingerprint, dict[str, Any]]] = OrderedDict()
+
+
+def clear_config_cache() -> None:
+    _CONFIG_CACHE.clear()
+    _TRUSTED_PAYLOADS.clear()
+    _YAML_CACHE.clear()
+
+
 def _strip_quotes(value: str) -> str:
     if len(value) < 2:
         return value
@@ -143,33 +171,107 @@ def load_env_file(path: str | Path = DEFAULT_ENV_PATH) -> dict[str, str]:
 
 
 def _replace_env_tokens(value: str, env_values: dict[str, str]) -> str:
-    def replacement(match: re.Match[str]) -> str:
-        env_name = match.group(1)
+    if ENV_TOKEN_OPEN not in value:
+        return value
+
+    parts: list[str] = []
+    start = 0
+    while True:
+        token_start = value.find(ENV_TOKEN_OPEN, start)
+        if token_start < 0:
+            break
+        name_start = token_start + len(ENV_TOKEN_OPEN)
+        token_end = value.find(ENV_TOKEN_CLOSE, name_start)
+        if token_end < 0:
+            break
+        env_name = value[name_start:token_end]
+        if not env_name or not ENV_NAME_CHARS.issuperset(env_name):
+            parts.append(value[start:name_start])
+            start = name_start
+            continue
         env_value = env_values.get(env_name)
         if env_value is None:
             raise ConfigLoadError(f"missing environment variable: {env_name}")
-        return env_value
-
-    return ENV_PATTERN.sub(replacement, value)
-
-
-def _resolve_env(value: Any, env_values: dict[str, str]) -> Any:
-    if isinstance(value, dict):
-        return {k: _resolve_env(v, env_values) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_resolve_env(item, env_values) for item in value]
-    if isinstance(value, str):
-        return _replace_env_tokens(value, env_values)
-    return value
+        parts.append(value[start:token_start])
+        parts.append(env_value)
+        start = token_end + len(ENV_TOKEN_CLOSE)
+    parts.append(value[start:])
+    return "".join(parts)
+
+
+def _resolve_env_inplace(root: dict[str, Any], env_values: dict[str, str]) -> dict[str, Any]:
+    """Substitute env tokens in a privately owned YAML tree without rebuilding it."""
+    stack: list[dict[str, Any] | list[Any]] = [root]
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if isinstance(value, str):
+                if ENV_TOKEN_OPEN in value:
+                    node[key] = _replace_env_tokens(value, env_values)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return root
 
 
 def load_config(path: str | Path = "config/default.yaml", env_path: str | Path = DEFAULT_ENV_PATH) -> AppConfig:
+    """Load and validate the app config, reusing the cached instance while both files are unchanged.
+
+    The returned ``AppConfig`` is shared between callers; it is frozen and holds no
+    mutable containers, so it is safe to keep.
+    """
     config_path = Path(path)
     if not config_path.exists():
         raise ConfigLoadError(f"config file not found: {config_path}")
+    env_file = Path(env_path)
+    if not env_file.exists():
+        raise ConfigLoadError(f"env file not found: {env_file}")
+
+    config_fingerprint = file_fingerprint(config_path)
+    stamp = (config_fingerprint, file_fingerprint(env_file))
+    cache_key = (config_fingerprint[0], stamp[1][0])
+    cached = cache_lookup(_CONFIG_CACHE, cache_key, stamp)
+    if cached is not None:
+        return cached
+    app_config = _load_config_uncached(config_path, config_fingerprint, env_file)
+    cache_store(_CONFIG_CACHE, cache_key, (stamp, app_config))
+    return app_config
+
+
+def _load_config_uncached(config_path: Path, config_fingerprint: FileFingerprint, env_path: Path) -> AppConfig:
+    raw_bytes = config_path.read_bytes()
+    env_values = load_env_file(env_path)
+    digest = _payload_digest(raw_bytes, env_values)
+    trusted = _TRUSTED_PAYLOADS.get(digest)
+    if trusted is not None:
+        _TRUSTED_PAYLOADS.move_to_end(digest)
+        return construct_trusted(AppConfig, trusted)
+
+    raw = cache_lookup(_YAML_CACHE, config_fingerprint[0], config_fingerprint)
+    if raw is None:
+        raw = _parse_yaml_mapping(config_path, raw_bytes)
+        cache_store(_YAML_CACHE, config_fingerprint[0], (config_fingerprint, raw))
+    # The cached tree is shared across loads, so substitute env tokens on a copy.
+    resolved = _resolve_env_inplace(copy.deepcopy(raw), env_values)
+    try:
+        app_config = _APP_CONFIG_ADAPTER.validate_python(resolved)
+    except ValidationError as exc:
+        raise ConfigLoadError("config validation failed") from exc
+    cache_store(_TRUSTED_PAYLOADS, digest, app_config.model_dump())
+    return app_config
+
 
+def _payload_digest(raw_bytes: bytes, env_values: dict[str, str]) -> str:
+    # Env values only enter the cache key through this digest, never verbatim.
+    digest = hashlib.sha256(raw_bytes)
+    for key in sorted(env_values):
+        digest.update(f"\0{key}={env_values[key]}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _parse_yaml_mapping(config_path: Path, raw_bytes: bytes) -> dict[str, Any]:
     try:
-        raw = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        raw = yaml.load(raw_bytes.decode("utf-8"), Loader=_YamlLoader)
     except yaml.YAMLError as exc:
         raise ConfigLoadError(f"invalid yaml format: {config_path}") from exc
 
@@ -177,10 +279,4 @@ def load_config(path: str | Path = "config/default.yaml", env_path: str | Path =
         raise ConfigLoadError(f"empty config file: {config_path}")
     if not isinstance(raw, dict):
         raise ConfigLoadError("config root must be a mapping")
-
-    env_values = load_env_file(env_path)
-    resolved = _resolve_env(raw, env_values)
-    try:
-        return AppConfig.model_validate(resolved)
-    except ValidationError as exc:
-        raise ConfigLoadError("config validation failed") from exc
+    return raw
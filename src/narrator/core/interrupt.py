@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from itertools import chain
 from typing import Any, Protocol
 
 from pydantic import Field
@@ -34,7 +35,6 @@ class InterruptManager:
     def check(self, world: WorldState, tick: int) -> tuple[InterruptSignal, ...]:
         if tick < 0:
             raise ValueError("tick must be >= 0")
-        signals: list[InterruptSignal] = []
-        for rule in self._rules:
-            signals.extend(rule.check(world, tick))
-        return tuple(signals)
+        if not self._rules:
+            return ()
+        return tuple(chain.from_iterable(rule.check(world, tick) for rule in self._rules))
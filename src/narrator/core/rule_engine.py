@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from bisect import insort
+from collections.abc import Callable
+from itertools import chain
 from typing import Any, Protocol
 
 from pydantic import Field
@@ -41,34 +44,49 @@ class Rule(Protocol):
         ...
 
 
+RuleMatch = Callable[[WorldState, RuleContext], bool]
+RuleApply = Callable[[WorldState, RuleContext], tuple[StateChange, ...]]
+
+
 class RuleEngine:
     """Execute rules in deterministic order and emit full audit trace."""
 
     def __init__(self) -> None:
-        self._rules: list[Rule] = []
+        self._ordered_rules: list[tuple[int, int, str, RuleMatch, RuleApply]] = []
 
     def register(self, rule: Rule) -> None:
         if not getattr(rule, "name", ""):
             raise ValueError("rule.name must not be empty")
-        self._rules.append(rule)
+        # Registration index is unique, so ordering never compares past it.
+        entry = (rule.priority, len(self._ordered_rules), rule.name, rule.match, rule.apply)
+        insort(self._ordered_rules, entry)
 
     def settle(self, world: WorldState, context: RuleContext) -> RuleEngineResult:
-        state_changes: list[StateChange] = []
+        change_groups: list[tuple[StateChange, ...]] = []
         audit_log: list[RuleExecutionRecord] = []
-        for _, rule in self._sorted_rules():
-            matched = rule.match(world, context)
-            changes = rule.apply(world, context) if matched else ()
-            state_changes.extend(changes)
+        for priority, _, name, match, apply in self._ordered_rules:
+            matched = match(world, context)
+            changes = apply(world, context) if matched else ()
+            if changes:
+                change_groups.append(changes)
+            # Records are built from registered rule metadata, so skip re-validation.
             audit_log.append(
-                RuleExecutionRecord(
-                    rule_name=rule.name,
-                    priority=rule.priority,
+                RuleExecutionRecord.model_construct(
+                    rule_name=name,
+                    priority=priority,
                     matched=matched,
                     state_change_count=len(changes),
                 )
             )
-        return RuleEngineResult(state_changes=tuple(state_changes), audit_log=tuple(audit_log))
-
-    def _sorted_rules(self) -> list[tuple[int, Rule]]:
-        indexed_rules = list(enumerate(self._rules))
-        return sorted(indexed_rules, key=lambda item: (item[1].priority, item[0]))
+        return RuleEngineResult.model_construct(
+            state_changes=_join_changes(change_groups),
+            audit_log=tuple(audit_log),
+        )
+
+
+def _join_changes(change_groups: list[tuple[StateChange, ...]]) -> tuple[StateChange, ...]:
+    if not change_groups:
+        return ()
+    if len(change_groups) == 1 and isinstance(change_groups[0], tuple):
+        return change_groups[0]
+    return tuple(chain.from_iterable(change_groups))
@@ -6,22 +6,50 @@ import hashlib
 import random
 
 DEFAULT_SEED_BYTES = 8
+SEED_VERSION_SHA256 = 1
+SEED_VERSION_BLAKE2B = 2
+DEFAULT_SEED_VERSION = SEED_VERSION_SHA256
 
 
 class SeedManager:
-    """Provide deterministic seed forking per subsystem label."""
-
-    def __init__(self, global_seed: int) -> None:
+    """Provide deterministic seed forking per subsystem label.
+
+    ``seed_version`` selects the derivation: version 1 truncates SHA-256 and
+    keeps seeds from existing runs replayable, version 2 uses the faster
+    8-byte BLAKE2b digest and yields different seeds. The version is a
+    constructor argument only; config does not select it, so callers opting
+    into version 2 must also record it to replay a run.
+    """
+
+    def __init__(self, global_seed: int, seed_version: int = DEFAULT_SEED_VERSION) -> None:
+        if seed_version not in (SEED_VERSION_SHA256, SEED_VERSION_BLAKE2B):
+            raise ValueError(f"unsupported seed_version: {seed_version}")
         self._global_seed = global_seed
+        self._seed_version = seed_version
+        self._prefix = f"{global_seed}:".encode("utf-8")
+        self._forked: dict[str, int] = {}
 
     def global_seed(self) -> int:
         return self._global_seed
 
+    def seed_version(self) -> int:
+        return self._seed_version
+
     def fork(self, label: str) -> int:
+        forked = self._forked.get(label)
+        if forked is not None:
+            return forked
         if not label:
             raise ValueError("label must not be empty")
-        digest = hashlib.sha256(f"{self._global_seed}:{label}".encode("utf-8")).digest()
-        return int.from_bytes(digest[:DEFAULT_SEED_BYTES], byteorder="big", signed=False)
+        data = self._prefix + label.encode("utf-8")
+        if self._seed_version == SEED_VERSION_BLAKE2B:
+            digest = hashlib.blake2b(data, digest_size=DEFAULT_SEED_BYTES).digest()
+        else:
+            digest = hashlib.sha256(data).digest()[:DEFAULT_SEED_BYTES]
+        forked = int.from_bytes(digest, byteorder="big", signed=False)
+        self._forked[label] = forked
+        return forked
 
     def rng(self, label: str) -> random.Random:
+        """Return a fresh generator; each call restarts the label's stream."""
         return random.Random(self.fork(label))
@@ -0,0 +1,36 @@
+"""Bounded per-path caches for files that are reloaded while unchanged."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, TypeVar
+
+# Caches keep the newest version per path and this many paths, so reloading rotated files stays bounded.
+MAX_CACHED_FILES = 16
+
+FileFingerprint = tuple[str, int, int]
+CacheKey = TypeVar("CacheKey")
+CacheValue = TypeVar("CacheValue")
+
+
+def file_fingerprint(path: Path) -> FileFingerprint:
+    stat = path.stat()
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+def cache_lookup(cache: OrderedDict[CacheKey, tuple[Any, CacheValue]], key: CacheKey, stamp: Any) -> CacheValue | None:
+    """Return the value cached under ``key`` if it was stored with ``stamp``, marking it recently used."""
+    entry = cache.get(key)
+    if entry is None or entry[0] != stamp:
+        return None
+    cache.move_to_end(key)
+    return entry[1]
+
+
+def cache_store(cache: OrderedDict[CacheKey, CacheValue], key: CacheKey, value: CacheValue) -> None:
+    """Store ``value`` as the newest entry and evict the oldest beyond ``MAX_CACHED_FILES``."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > MAX_CACHED_FILES:
+        cache.popitem(last=False)
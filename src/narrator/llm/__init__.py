@@ -2,6 +2,7 @@
 
 from .anthropic import AnthropicProvider
 from .base import (
+    HTTPProvider,
     LLMProvider,
     LLMRequest,
     LLMResponse,
@@ -24,6 +25,7 @@ from .schemas import (
 __all__ = [
     # Base
     "LLMProvider",
+    "HTTPProvider",
     "LLMRequest",
     "LLMResponse",
     "ProviderError",
@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import random
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any, Generic, TypeVar
 
-from .schemas import HealthCheckResponse, StructuredResponse
+import httpx
+
+from .schemas import HealthCheckResponse, StructuredResponse, validate_structured_response_json
 
 T = TypeVar("T", bound=StructuredResponse)
 
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 32
+WARMUP_USER_PROMPT = "ping"
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 1.0
+MAX_RETRY_DELAY = 30.0
+SSE_DATA_PREFIX = "data:"
+# Any of these while reading a decoded body means the provider sent an unexpected shape.
+BODY_SHAPE_ERRORS = (KeyError, IndexError, TypeError, AttributeError, ValueError)
+
 
 @dataclass(frozen=True)
 class LLMRequest:
@@ -20,6 +36,7 @@ class LLMRequest:
     temperature: float = field(default=0.7)
     max_tokens: int = field(default=1024)
     top_p: float = field(default=1.0)
+    include_raw: bool = field(default=False)
 
 
 @dataclass(frozen=True)
@@ -44,6 +61,25 @@ class ProviderValidationError(ProviderError):
     """Raised when response validation fails."""
 
 
+def create_http_client(
+    base_url: str,
+    timeout: float,
+    headers: dict[str, str] | None = None,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Create the long-lived pooled HTTP client a provider reuses across calls."""
+    return httpx.AsyncClient(
+        base_url=base_url,
+        timeout=timeout,
+        headers=headers,
+        transport=transport,
+        limits=httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
+
 class LLMProvider(ABC, Generic[T]):
     """Abstract base class for LLM providers.
 
@@ -51,6 +87,9 @@ class LLMProvider(ABC, Generic[T]):
     implement the abstract methods.
     """
 
+    # Only servers that reuse a cached system-prompt prefix benefit from ``warmup``.
+    supports_prefix_cache: bool = False
+
     def __init__(self, model: str, **kwargs: Any) -> None:
         """Initialize the provider.
 
@@ -71,6 +110,52 @@ class LLMProvider(ABC, Generic[T]):
         """Return the provider name for logging."""
         return self.__class__.__name__
 
+    async def aclose(self) -> None:
+        """Release resources held by the provider, such as pooled connections."""
+
+    async def __aenter__(self) -> "LLMProvider[T]":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def can_batch(self, requests: list[LLMRequest]) -> bool:
+        """Return whether ``complete_batch`` can serve these requests with one native call."""
+        return False
+
+    async def complete_batch(self, requests: list[LLMRequest]) -> list[LLMResponse]:
+        """Complete several requests, in input order.
+
+        Providers without native batching issue the requests concurrently.
+
+        Args:
+            requests: The completion requests
+
+        Returns:
+            One response per request in input order
+        """
+        return list(await asyncio.gather(*(self.complete(request) for request in requests)))
+
+    async def warmup(self, system_prompt: str) -> None:
+        """Send a one-token request so the server caches the shared system prompt prefix.
+
+        Does nothing unless the provider sets ``supports_prefix_cache``, so hosted
+        APIs are not billed for a request that buys them nothing.
+
+        Args:
+            system_prompt: The system prompt reused by the upcoming requests
+        """
+        if not self.supports_prefix_cache:
+            return
+        await self.complete(
+            LLMRequest(
+                system_prompt=system_prompt,
+                user_prompt=WARMUP_USER_PROMPT,
+                temperature=0.0,
+                max_tokens=1,
+            )
+        )
+
     @abstractmethod
     async def health_check(self) -> HealthCheckResponse:
         """Check if the provider is healthy and available.
@@ -92,6 +177,36 @@ class LLMProvider(ABC, Generic[T]):
         """
         pass
 
+    async def complete_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Yield the completion text as it is generated.
+
+        Providers without a streaming transport yield the whole completion as one chunk.
+
+        Args:
+            request: The completion request payload
+
+        Yields:
+            Successive fragments of the generated content
+        """
+        response = await self.complete(request)
+        yield response.content
+
+    async def complete_structured_streamed(
+        self, request: LLMRequest, response_type: type[T]
+    ) -> T:
+        """Perform a structured completion over a streaming transport when available.
+
+        Providers without a streaming transport fall back to ``complete_structured``.
+
+        Args:
+            request: The completion request payload
+            response_type: The expected response schema type
+
+        Returns:
+            Validated structured response object
+        """
+        return await self.complete_structured(request, response_type)
+
     @abstractmethod
     async def complete_structured(
         self, request: LLMRequest, response_type: type[T]
@@ -134,3 +249,252 @@ class LLMProvider(ABC, Generic[T]):
         if not is_valid or validated is None:
             raise ProviderValidationError(error_msg)
         return validated
+
+
+def _is_transient_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
+class HTTPProvider(LLMProvider[T]):
+    """Shared HTTP core for providers that exchange JSON over a pooled client.
+
+    Subclasses describe the wire format through ``_build_payload``,
+    ``_build_structured_payload``, ``_extract_content`` and ``_extract_usage``;
+    transport, status handling and error mapping live here.
+    """
+
+    completion_path: str = ""
+    health_path: str = ""
+    default_timeout: float = 30.0
+
+    def __init__(
+        self,
+        model: str,
+        base_url: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the provider and its pooled HTTP client.
+
+        Args:
+            model: The model identifier to use
+            base_url: API base URL
+            headers: Headers sent with every request
+            **kwargs: Additional configuration (``timeout``, ``max_retries``,
+                ``retry_backoff``, ``transport``, ...)
+
+        Raises:
+            ValueError: If ``max_retries`` is negative
+        """
+        super().__init__(model, **kwargs)
+        self._base_url = base_url.rstrip("/")
+        self._timeout = kwargs.get("timeout", self.default_timeout)
+        self._max_retries = kwargs.get("max_retries", DEFAULT_MAX_RETRIES)
+        if self._max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {self._max_retries}")
+        self._retry_backoff = kwargs.get("retry_backoff", DEFAULT_RETRY_BACKOFF)
+        self._client = create_http_client(
+            self._base_url,
+            self._timeout,
+            headers=headers,
+            transport=kwargs.get("transport"),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def health_check(self) -> HealthCheckResponse:
+        """Check if the provider API is available."""
+        try:
+            response = await self._probe_health()
+            if self._is_healthy_status(response.status_code):
+                return HealthCheckResponse(healthy=True, message="OK")
+            return HealthCheckResponse(
+                healthy=False, message=f"status code: {response.status_code}"
+            )
+        except httpx.ConnectError as e:
+            return HealthCheckResponse(healthy=False, message=f"connection failed: {e}")
+        except Exception as e:
+            return HealthCheckResponse(healthy=False, message=str(e))
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """Perform a standard completion request."""
+        data = await self._post_json(self._build_payload(request))
+        try:
+            content = self._extract_content(data)
+            usage = self._extract_usage(data)
+        except BODY_SHAPE_ERRORS as e:
+            raise ProviderError(f"unexpected error: {e}") from e
+        return LLMResponse(
+            content=content,
+            model=self._model,
+            usage=usage,
+            raw_response=data if request.include_raw else None,
+        )
+
+    async def complete_structured(
+        self, request: LLMRequest, response_type: type[T]
+    ) -> T:
+        """Perform a completion request with structured output."""
+        data = await self._post_json(self._build_structured_payload(request, response_type))
+        try:
+            content = self._extract_content(data)
+        except BODY_SHAPE_ERRORS as e:
+            raise ProviderError(f"unexpected error: {e}") from e
+
+        # Parse and validate the JSON response against the schema in one pass
+        is_valid, validated, error_msg = validate_structured_response_json(content, response_type)
+        if not is_valid or validated is None:
+            raise ProviderValidationError(f"schema validation failed: {error_msg}")
+        return validated
+
+    async def complete_stream(self, request: LLMRequest) -> AsyncIterator[str]:
+        """Stream a standard completion, yielding content fragments as they arrive."""
+        payload = self._build_payload(request)
+        async for fragment in self._stream_fragments(payload):
+            yield fragment
+
+    async def complete_structured_streamed(
+        self, request: LLMRequest, response_type: type[T]
+    ) -> T:
+        """Stream a structured completion and validate it as soon as the JSON closes."""
+        fragments = self._stream_fragments(self._build_structured_payload(request, response_type))
+        chunks: list[str] = []
+        checked = 0
+        last_char = ""
+        error_msg = "empty response"
+        try:
+            async for fragment in fragments:
+                chunks.append(fragment)
+                last_char = fragment.rstrip()[-1:] or last_char
+                # Only a closing bracket can end a JSON document; skip parsing partial fragments
+                if last_char not in ("}", "]"):
+                    continue
+                checked = len(chunks)
+                is_valid, validated, error_msg = validate_structured_response_json(
+                    "".join(chunks), response_type
+                )
+                if is_valid and validated is not None:
+                    return validated
+        finally:
+            await fragments.aclose()
+
+        if checked != len(chunks):
+            is_valid, validated, error_msg = validate_structured_response_json(
+                "".join(chunks), response_type
+            )
+            if is_valid and validated is not None:
+                return validated
+        raise ProviderValidationError(f"schema validation failed: {error_msg}")
+
+    async def _stream_fragments(self, payload: dict[str, Any]) -> AsyncIterator[str]:
+        """POST a payload with streaming enabled and yield its content fragments."""
+        payload["stream"] = True
+        try:
+            async with self._client.stream("POST", self.completion_path, json=payload) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise ProviderError(f"API error: {response.status_code} - {response.text}")
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    fragment = self._parse_stream_line(line)
+                    if fragment:
+                        yield fragment
+        except ProviderError:
+            raise
+        except httpx.ConnectError as e:
+            raise ProviderUnavailableError(f"connection failed: {e}") from e
+        except Exception as e:
+            raise ProviderError(f"unexpected error: {e}") from e
+
+    async def _post_json(self, payload: dict[str, Any], path: str | None = None) -> dict[str, Any]:
+        """POST a payload to the completion endpoint and decode the JSON body.
+
+        Args:
+            payload: The request body
+            path: Endpoint to post to (defaults to ``completion_path``)
+
+        Returns:
+            The decoded response body
+
+        Raises:
+            ProviderUnavailableError: If the API cannot be reached
+            ProviderError: If the API answers with an error or an undecodable body
+        """
+        for attempt in range(self._max_retries + 1):
+            try:
+                response = await self._client.post(path or self.completion_path, json=payload)
+            except httpx.ConnectError as e:
+                raise ProviderUnavailableError(f"connection failed: {e}") from e
+            except Exception as e:
+                raise ProviderError(f"unexpected error: {e}") from e
+            if not _is_transient_status(response.status_code) or attempt == self._max_retries:
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
+
+        if response.status_code != 200:
+            raise ProviderError(f"API error: {response.status_code} - {response.text}")
+        try:
+            return response.json()
+        except ValueError as e:
+            raise ProviderError(f"unexpected error: {e}") from e
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Return the pause before retrying, honouring a numeric Retry-After header."""
+        try:
+            retry_after = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            retry_after = 0.0
+        if retry_after > 0:
+            return min(retry_after, MAX_RETRY_DELAY)
+        backoff = self._retry_backoff * 2**attempt
+        return min(backoff + random.uniform(0, self._retry_backoff), MAX_RETRY_DELAY)
+
+    async def _probe_health(self) -> httpx.Response:
+        """Issue the request whose status code decides provider health."""
+        return await self._client.get(self.health_path)
+
+    def _is_healthy_status(self, status_code: int) -> bool:
+        return status_code == 200
+
+    @abstractmethod
+    def _build_payload(self, request: LLMRequest) -> dict[str, Any]:
+        """Build the request body for a standard completion."""
+
+    @abstractmethod
+    def _build_structured_payload(
+        self, request: LLMRequest, response_type: type[T]
+    ) -> dict[str, Any]:
+        """Build the request body for a structured completion."""
+
+    @abstractmethod
+    def _extract_content(self, data: dict[str, Any]) -> str:
+        """Return the generated text from a decoded response body."""
+
+    @abstractmethod
+    def _extract_usage(self, data: dict[str, Any]) -> dict[str, int]:
+        """Return token usage from a decoded response body."""
+
+    @abstractmethod
+    def _parse_stream_line(self, line: str) -> str | None:
+        """Return the content fragment carried by one line of a streamed response."""
+
+
+def sse_event_data(line: str) -> dict[str, Any] | None:
+    """Decode the JSON payload of a server-sent-events ``data:`` line.
+
+    Args:
+        line: One line of an event stream
+
+    Returns:
+        The decoded event, or None for comments, other fields and the ``[DONE]`` sentinel
+    """
+    if not line.startswith(SSE_DATA_PREFIX):
+        return None
+    data = line[len(SSE_DATA_PREFIX):].strip()
+    if not data or data == "[DONE]":
+        return None
+    return json.loads(data)
+
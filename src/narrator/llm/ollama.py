@@ -5,24 +5,20 @@ from __future__ import annotations
 import json
 from typing import Any, TypeVar
 
-import httpx
-
-from .base import (
-    LLMProvider,
-    LLMRequest,
-    LLMResponse,
-    ProviderError,
-    ProviderUnavailableError,
-    ProviderValidationError,
-)
-from .schemas import HealthCheckResponse, StructuredResponse, validate_structured_response
+from .base import HTTPProvider, LLMRequest, ProviderError
+from .schemas import StructuredResponse, response_json_schema
 
 T = TypeVar("T", bound=StructuredResponse)
 
 
-class OllamaProvider(LLMProvider[T]):
+class OllamaProvider(HTTPProvider[T]):
     """Ollama API provider implementation."""
 
+    completion_path = "/api/generate"
+    health_path = "/api/tags"
+    default_timeout = 60.0
+    supports_prefix_cache = True
+
     def __init__(
         self,
         model: str,
@@ -36,129 +32,41 @@ class OllamaProvider(LLMProvider[T]):
             base_url: Ollama API base URL (default: http://localhost:11434)
             **kwargs: Additional configuration
         """
-        super().__init__(model, **kwargs)
-        self._base_url = base_url.rstrip("/")
+        super().__init__(model, base_url, **kwargs)
         self._num_predict = kwargs.get("num_predict", 1024)
-        self._timeout = kwargs.get("timeout", 60.0)
-
-    async def health_check(self) -> HealthCheckResponse:
-        """Check if the Ollama API is available."""
-        try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(f"{self._base_url}/api/tags")
-                if response.status_code == 200:
-                    return HealthCheckResponse(healthy=True, message="OK")
-                return HealthCheckResponse(
-                    healthy=False, message=f"status code: {response.status_code}"
-                )
-        except httpx.ConnectError as e:
-            return HealthCheckResponse(healthy=False, message=f"connection failed: {e}")
-        except Exception as e:
-            return HealthCheckResponse(healthy=False, message=str(e))
-
-    async def complete(self, request: LLMRequest) -> LLMResponse:
-        """Perform a standard completion request."""
-        try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                payload = {
-                    "model": self._model,
-                    "prompt": request.user_prompt,
-                    "system": request.system_prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": request.temperature,
-                        "top_p": request.top_p,
-                        "num_predict": request.max_tokens or self._num_predict,
-                    },
-                }
-
-                response = await client.post(
-                    f"{self._base_url}/api/generate",
-                    json=payload,
-                )
-
-                if response.status_code != 200:
-                    raise ProviderError(f"API error: {response.status_code} - {response.text}")
-
-                data = response.json()
-                content = data.get("response", "")
-
-                usage = {
-                    "prompt_tokens": data.get("prompt_eval_count", 0),
-                    "completion_tokens": data.get("eval_count", 0),
-                    "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0),
-                }
-
-                return LLMResponse(
-                    content=content,
-                    model=self._model,
-                    usage=usage,
-                    raw_response=data,
-                )
-
-        except httpx.ConnectError as e:
-            raise ProviderUnavailableError(f"connection failed: {e}") from e
-        except Exception as e:
-            if isinstance(e, ProviderError):
-                raise
-            raise ProviderError(f"unexpected error: {e}") from e
 
-    async def complete_structured(
+    def _build_payload(self, request: LLMRequest) -> dict[str, Any]:
+        return {
+            "model": self._model,
+            "prompt": request.user_prompt,
+            "system": request.system_prompt,
+            "stream": False,
+            "options": {
+                "temperature": request.temperature,
+                "top_p": request.top_p,
+                "num_predict": request.max_tokens or self._num_predict,
+            },
+        }
+
+    def _build_structured_payload(
         self, request: LLMRequest, response_type: type[T]
-    ) -> T:
-        """Perform a completion request with structured output."""
-        try:
-            schema_json = response_type.model_json_schema()
-
-            # Add schema instructions to the prompt
-            user_prompt = (
-                f"{request.user_prompt}\n\n"
-                f"Respond with a valid JSON object matching this schema: {json.dumps(schema_json)}"
-            )
-
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                payload = {
-                    "model": self._model,
-                    "prompt": user_prompt,
-                    "system": request.system_prompt,
-                    "format": "json",  # Ollama's JSON mode
-                    "stream": False,
-                    "options": {
-                        "temperature": request.temperature,
-                        "top_p": request.top_p,
-                        "num_predict": request.max_tokens or self._num_predict,
-                    },
-                }
-
-                response = await client.post(
-                    f"{self._base_url}/api/generate",
-                    json=payload,
-                )
-
-                if response.status_code != 200:
-                    raise ProviderError(f"API error: {response.status_code} - {response.text}")
-
-                data = response.json()
-                content = data.get("response", "")
-
-                # Parse and validate the JSON response
-                try:
-                    response_data = json.loads(content)
-                except json.JSONDecodeError as e:
-                    raise ProviderValidationError(f"invalid JSON in response: {e}") from e
-
-                # Validate against the schema
-                is_valid, validated, error_msg = validate_structured_response(
-                    response_data, response_type
-                )
-                if not is_valid or validated is None:
-                    raise ProviderValidationError(f"schema validation failed: {error_msg}")
-
-                return validated
-
-        except httpx.ConnectError as e:
-            raise ProviderUnavailableError(f"connection failed: {e}") from e
-        except Exception as e:
-            if isinstance(e, (ProviderError, ProviderValidationError)):
-                raise
-            raise ProviderError(f"unexpected error: {e}") from e
+    ) -> dict[str, Any]:
+        payload = self._build_payload(request)
+        payload["format"] = response_json_schema(response_type)  # Ollama's schema-constrained output
+        return payload
+
+    def _extract_content(self, data: dict[str, Any]) -> str:
+        return data.get("response", "")
+
+    def _extract_usage(self, data: dict[str, Any]) -> dict[str, int]:
+        return {
+            "prompt_tokens": data.get("prompt_eval_count", 0),
+            "completion_tokens": data.get("eval_count", 0),
+            "total_tokens": data.get("prompt_eval_count", 0) + data.get("eval_count", 0),
+        }
+
+    def _parse_stream_line(self, line: str) -> str | None:
+        frame = json.loads(line)
+        if "error" in frame:  # Ollama reports mid-stream failures as an error frame
+            raise ProviderError(f"stream error: {frame['error']}")
+        return frame.get("response")
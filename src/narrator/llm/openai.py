@@ -2,27 +2,21 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any, TypeVar
 
-import httpx
-
-from .base import (
-    LLMProvider,
-    LLMRequest,
-    LLMResponse,
-    ProviderError,
-    ProviderUnavailableError,
-    ProviderValidationError,
-)
-from .schemas import HealthCheckResponse, StructuredResponse, validate_structured_response
+from .base import BODY_SHAPE_ERRORS, HTTPProvider, LLMRequest, LLMResponse, ProviderError, sse_event_data
+from .schemas import StructuredResponse, response_json_schema
 
 T = TypeVar("T", bound=StructuredResponse)
 
 
-class OpenAIProvider(LLMProvider[T]):
+class OpenAIProvider(HTTPProvider[T]):
     """OpenAI API provider implementation."""
 
+    completion_path = "/chat/completions"
+    batch_completion_path = "/completions"
+    health_path = "/models"
+
     def __init__(
         self, model: str, api_key: str, base_url: str = "https://api.openai.com/v1", **kwargs: Any
     ) -> None:
@@ -32,142 +26,103 @@ class OpenAIProvider(LLMProvider[T]):
             model: The model identifier (e.g., "gpt-4", "gpt-3.5-turbo")
             api_key: OpenAI API key
             base_url: API base URL (default: https://api.openai.com/v1)
-            **kwargs: Additional configuration
+            **kwargs: Additional configuration; ``supports_batch_prompts`` enables
+                multi-prompt ``/completions`` batching on self-hosted endpoints such as vLLM
         """
-        super().__init__(model, **kwargs)
         self._api_key = api_key
-        self._base_url = base_url.rstrip("/")
+        super().__init__(
+            model,
+            base_url,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            **kwargs,
+        )
         self._max_tokens = kwargs.get("max_tokens", 1024)
-        self._timeout = kwargs.get("timeout", 30.0)
-
-    async def health_check(self) -> HealthCheckResponse:
-        """Check if the OpenAI API is available."""
-        try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(
-                    f"{self._base_url}/models",
-                    headers={"Authorization": f"Bearer {self._api_key}"},
-                )
-                if response.status_code == 200:
-                    return HealthCheckResponse(healthy=True, message="OK")
-                return HealthCheckResponse(
-                    healthy=False, message=f"status code: {response.status_code}"
-                )
-        except httpx.ConnectError as e:
-            return HealthCheckResponse(healthy=False, message=f"connection failed: {e}")
-        except Exception as e:
-            return HealthCheckResponse(healthy=False, message=str(e))
-
-    async def complete(self, request: LLMRequest) -> LLMResponse:
-        """Perform a standard completion request."""
+        self._supports_batch_prompts = kwargs.get("supports_batch_prompts", False)
+
+    def can_batch(self, requests: list[LLMRequest]) -> bool:
+        """Return whether the requests can share one multi-prompt completion call."""
+        if not self._supports_batch_prompts or len(requests) < 2:
+            return False
+        first = requests[0]
+        return all(
+            (r.system_prompt, r.temperature, r.max_tokens, r.top_p, r.include_raw)
+            == (first.system_prompt, first.temperature, first.max_tokens, first.top_p, first.include_raw)
+            for r in requests[1:]
+        )
+
+    async def complete_batch(self, requests: list[LLMRequest]) -> list[LLMResponse]:
+        """Complete requests that share one system prompt with a single multi-prompt call."""
+        if not self.can_batch(requests):
+            return await super().complete_batch(requests)
+        first = requests[0]
+        payload = {
+            "model": self._model,
+            "prompt": [f"{first.system_prompt}\n\n{r.user_prompt}" for r in requests],
+            "temperature": first.temperature,
+            "max_tokens": first.max_tokens or self._max_tokens,
+            "top_p": first.top_p,
+        }
+        data = await self._post_json(payload, path=self.batch_completion_path)
         try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                payload = {
-                    "model": self._model,
-                    "messages": [
-                        {"role": "system", "content": request.system_prompt},
-                        {"role": "user", "content": request.user_prompt},
-                    ],
-                    "temperature": request.temperature,
-                    "max_tokens": request.max_tokens or self._max_tokens,
-                    "top_p": request.top_p,
-                }
-
-                response = await client.post(
-                    f"{self._base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self._api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                )
-
-                if response.status_code != 200:
-                    raise ProviderError(f"API error: {response.status_code} - {response.text}")
-
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-
-                usage = {}
-                if "usage" in data:
-                    usage = {
-                        "prompt_tokens": data["usage"].get("prompt_tokens", 0),
-                        "completion_tokens": data["usage"].get("completion_tokens", 0),
-                        "total_tokens": data["usage"].get("total_tokens", 0),
-                    }
-
-                return LLMResponse(
-                    content=content,
-                    model=self._model,
-                    usage=usage,
-                    raw_response=data,
-                )
-
-        except httpx.ConnectError as e:
-            raise ProviderUnavailableError(f"connection failed: {e}") from e
-        except Exception as e:
-            if isinstance(e, ProviderError):
-                raise
+            choices = sorted(data["choices"], key=lambda choice: choice["index"])
+            contents = [choice["text"] for choice in choices]
+        except BODY_SHAPE_ERRORS as e:
             raise ProviderError(f"unexpected error: {e}") from e
-
-    async def complete_structured(
+        if len(choices) != len(requests):
+            raise ProviderError(f"batch returned {len(choices)} choices for {len(requests)} prompts")
+        return [
+            LLMResponse(
+                content=content,
+                model=self._model,
+                raw_response=choice if first.include_raw else None,
+            )
+            for choice, content in zip(choices, contents)
+        ]
+
+    def _build_payload(self, request: LLMRequest) -> dict[str, Any]:
+        return {
+            "model": self._model,
+            "messages": [
+                {"role": "system", "content": request.system_prompt},
+                {"role": "user", "content": request.user_prompt},
+            ],
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens or self._max_tokens,
+            "top_p": request.top_p,
+        }
+
+    def _build_structured_payload(
         self, request: LLMRequest, response_type: type[T]
-    ) -> T:
-        """Perform a completion request with structured output."""
-        try:
-            # Try to use JSON mode if the model supports it
-            schema_json = response_type.model_json_schema()
-
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                payload = {
-                    "model": self._model,
-                    "messages": [
-                        {"role": "system", "content": request.system_prompt},
-                        {
-                            "role": "user",
-                            "content": request.user_prompt
-                            + f"\n\nRespond with a valid JSON matching this schema: {json.dumps(schema_json)}",
-                        },
-                    ],
-                    "temperature": request.temperature,
-                    "max_tokens": request.max_tokens or self._max_tokens,
-                    "top_p": request.top_p,
-                    "response_format": {"type": "json_object"},
-                }
-
-                response = await client.post(
-                    f"{self._base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self._api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json=payload,
-                )
-
-                if response.status_code != 200:
-                    raise ProviderError(f"API error: {response.status_code} - {response.text}")
-
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-
-                # Parse and validate the JSON response
-                try:
-                    response_data = json.loads(content)
-                except json.JSONDecodeError as e:
-                    raise ProviderValidationError(f"invalid JSON in response: {e}") from e
-
-                # Validate against the schema
-                is_valid, validated, error_msg = validate_structured_response(
-                    response_data, response_type
-                )
-                if not is_valid or validated is None:
-                    raise ProviderValidationError(f"schema validation failed: {error_msg}")
-
-                return validated
-
-        except httpx.ConnectError as e:
-            raise ProviderUnavailableError(f"connection failed: {e}") from e
-        except Exception as e:
-            if isinstance(e, (ProviderError, ProviderValidationError)):
-                raise
-            raise ProviderError(f"unexpected error: {e}") from e
+    ) -> dict[str, Any]:
+        payload = self._build_payload(request)
+        # Schema-guided decoding; not strict because open dict fields are not strict-compatible
+        payload["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": response_type.__name__,
+                "schema": response_json_schema(response_type),
+                "strict": False,
+            },
+        }
+        return payload
+
+    def _extract_content(self, data: dict[str, Any]) -> str:
+        return data["choices"][0]["message"]["content"]
+
+    def _extract_usage(self, data: dict[str, Any]) -> dict[str, int]:
+        if "usage" not in data:
+            return {}
+        return {
+            "prompt_tokens": data["usage"].get("prompt_tokens", 0),
+            "completion_tokens": data["usage"].get("completion_tokens", 0),
+            "total_tokens": data["usage"].get("total_tokens", 0),
+        }
+
+    def _parse_stream_line(self, line: str) -> str | None:
+        event = sse_event_data(line)
+        if not event or not event.get("choices"):
+            return None
+        return event["choices"][0].get("delta", {}).get("content")
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
 from typing import Any, Generic, TypeVar
 
 from .anthropic import AnthropicProvider
@@ -29,14 +33,24 @@ class ProviderNotConfiguredError(RouterError):
 class LLMRouter(Generic[T]):
     """Router for managing and switching between LLM providers."""
 
-    def __init__(self, default_provider_name: str = "openai") -> None:
+    def __init__(self, default_provider_name: str = "openai", max_cache_size: int = 512) -> None:
         """Initialize the LLM router.
 
         Args:
             default_provider_name: The default provider to use
+            max_cache_size: Number of deterministic (temperature 0) responses kept in the LRU cache;
+                0 disables caching
+
+        Raises:
+            ValueError: If max_cache_size is negative
         """
+        if max_cache_size < 0:
+            raise ValueError(f"max_cache_size must be >= 0, got {max_cache_size}")
         self._providers: dict[str, LLMProvider[T]] = {}
         self._default_provider_name = default_provider_name
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._cache: OrderedDict[Hashable, Any] = OrderedDict()
+        self._max_cache_size = max_cache_size
 
     def register_provider(
         self, name: str, provider: LLMProvider[T], config: dict[str, Any]
@@ -90,22 +104,58 @@ class LLMRouter(Generic[T]):
         """Get list of available provider names."""
         return list(self._providers.keys())
 
+    async def aclose(self) -> None:
+        """Close every registered provider and release its pooled connections."""
+        for provider in self._providers.values():
+            await provider.aclose()
+
+    async def __aenter__(self) -> "LLMRouter[T]":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     async def health_check_all(self) -> dict[str, HealthCheckResponse]:
         """Check health of all registered providers.
 
         Returns:
             Dict mapping provider names to health check responses
+
+        Raises:
+            asyncio.CancelledError: If a provider's check was cancelled; other
+                BaseExceptions such as KeyboardInterrupt are re-raised as well
         """
+        names = list(self._providers)
+        outcomes = await asyncio.gather(
+            *(provider.health_check() for provider in self._providers.values()),
+            return_exceptions=True,
+        )
         results = {}
-        for name, provider in self._providers.items():
-            try:
-                results[name] = await provider.health_check()
-            except Exception as e:
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
                 results[name] = HealthCheckResponse(
-                    healthy=False, message=f"error checking health: {e}"
+                    healthy=False, message=f"error checking health: {outcome}"
                 )
+            elif isinstance(outcome, BaseException):
+                # gather returns these in-band too; they must not pass as a health response
+                raise outcome
+            else:
+                results[name] = outcome
         return results
 
+    async def warmup(self, system_prompt: str, provider_name: str | None = None) -> None:
+        """Prime the provider's prefix cache with a system prompt shared by upcoming requests.
+
+        Args:
+            system_prompt: The shared system prompt
+            provider_name: The provider to use (uses default if None)
+
+        Raises:
+            ProviderNotConfiguredError: If the provider is not found
+        """
+        provider = self.get_provider(provider_name)
+        await provider.warmup(system_prompt)
+
     async def complete(self, request: LLMRequest, provider_name: str | None = None) -> LLMResponse:
         """Route a completion request to the appropriate provider.
 
@@ -120,7 +170,30 @@ class LLMRouter(Generic[T]):
             ProviderNotConfiguredError: If the provider is not found
         """
         provider = self.get_provider(provider_name)
-        return await provider.complete(request)
+        return await self._dispatch(
+            (provider_name or self._default_provider_name, provider.model, request),
+            request,
+            lambda: provider.complete(request),
+        )
+
+    async def complete_stream(
+        self, request: LLMRequest, provider_name: str | None = None
+    ) -> AsyncIterator[str]:
+        """Route a streaming completion request to the appropriate provider.
+
+        Args:
+            request: The completion request
+            provider_name: The provider to use (uses default if None)
+
+        Yields:
+            Successive fragments of the generated content
+
+        Raises:
+            ProviderNotConfiguredError: If the provider is not found
+        """
+        provider = self.get_provider(provider_name)
+        async for fragment in provider.complete_stream(request):
+            yield fragment
 
     async def complete_structured(
         self, request: LLMRequest, response_type: type[T], provider_name: str | None = None
@@ -139,7 +212,138 @@ class LLMRouter(Generic[T]):
             ProviderNotConfiguredError: If the provider is not found
         """
         provider = self.get_provider(provider_name)
-        return await provider.complete_structured(request, response_type)
+        return await self._dispatch(
+            (provider_name or self._default_provider_name, provider.model, request, response_type),
+            request,
+            lambda: provider.complete_structured(request, response_type),
+        )
+
+    async def complete_structured_streamed(
+        self, request: LLMRequest, response_type: type[T], provider_name: str | None = None
+    ) -> T:
+        """Route a structured completion request over the provider's streaming transport.
+
+        Args:
+            request: The completion request
+            response_type: The expected response schema type
+            provider_name: The provider to use (uses default if None)
+
+        Returns:
+            The validated structured response
+
+        Raises:
+            ProviderNotConfiguredError: If the provider is not found
+        """
+        provider = self.get_provider(provider_name)
+        return await provider.complete_structured_streamed(request, response_type)
+
+    async def complete_many(
+        self,
+        requests: list[LLMRequest],
+        *,
+        max_concurrent: int = 8,
+        provider_name: str | None = None,
+    ) -> list[LLMResponse | BaseException]:
+        """Route several independent completion requests concurrently.
+
+        When the provider can serve all requests with one native batch call, that
+        call is made directly: it bypasses the temperature-0 response cache and
+        in-flight coalescing that ``complete`` applies, and a batch failure is
+        returned in every slot.
+
+        Args:
+            requests: The completion requests
+            max_concurrent: Upper bound on in-flight requests
+            provider_name: The provider to use (uses default if None)
+
+        Returns:
+            One entry per request in input order; failures are returned in place as exceptions
+
+        Raises:
+            ValueError: If max_concurrent is less than 1
+            ProviderNotConfiguredError: If the provider is not found
+        """
+        _check_max_concurrent(max_concurrent)
+        provider = self.get_provider(provider_name)
+        if provider.can_batch(requests):
+            try:
+                return list(await provider.complete_batch(requests))
+            except Exception as e:
+                return [e] * len(requests)
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run(request: LLMRequest) -> LLMResponse:
+            async with semaphore:
+                return await self.complete(request, provider_name)
+
+        return await asyncio.gather(*(run(request) for request in requests), return_exceptions=True)
+
+    async def complete_structured_many(
+        self,
+        requests: list[LLMRequest],
+        response_type: type[T],
+        *,
+        max_concurrent: int = 8,
+        provider_name: str | None = None,
+    ) -> list[T | BaseException]:
+        """Route several independent structured completion requests concurrently.
+
+        Args:
+            requests: The completion requests
+            response_type: The expected response schema type
+            max_concurrent: Upper bound on in-flight requests
+            provider_name: The provider to use (uses default if None)
+
+        Returns:
+            One entry per request in input order; failures are returned in place as exceptions
+
+        Raises:
+            ValueError: If max_concurrent is less than 1
+            ProviderNotConfiguredError: If the provider is not found
+        """
+        _check_max_concurrent(max_concurrent)
+        self.get_provider(provider_name)
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run(request: LLMRequest) -> T:
+            async with semaphore:
+                return await self.complete_structured(request, response_type, provider_name)
+
+        return await asyncio.gather(*(run(request) for request in requests), return_exceptions=True)
+
+    async def _dispatch(
+        self, key: Hashable, request: LLMRequest, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Serve deterministic requests from the LRU cache or one shared in-flight call.
+
+        Only temperature-0 requests are cached or coalesced; sampled requests always
+        reach the provider so duplicates yield independent samples. Cached results
+        are handed out as deep copies, so a caller mutating ``usage`` or
+        ``raw_response`` cannot change what later hits return. With the cache
+        disabled, coalesced callers share the in-flight result object.
+        """
+        if request.temperature != 0.0:
+            return await call()
+        if self._max_cache_size == 0:
+            return await self._coalesce(key, call)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return copy.deepcopy(self._cache[key])
+        result = await self._coalesce(key, call)
+        self._cache[key] = result
+        if len(self._cache) > self._max_cache_size:
+            self._cache.popitem(last=False)
+        return copy.deepcopy(result)
+
+    async def _coalesce(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Share one in-flight provider call between concurrent identical requests."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller's cancellation does not cancel the call for the others
+        return await asyncio.shield(task)
 
     @classmethod
     def from_config(cls, config: dict[str, Any]) -> "LLMRouter[T]":
@@ -165,6 +369,7 @@ class LLMRouter(Generic[T]):
                     api_key=openai_config["api_key"],
                     base_url=openai_config["base_url"],
                     max_tokens=openai_config.get("max_tokens", 1024),
+                    supports_batch_prompts=openai_config.get("supports_batch_prompts", False),
                 ),
                 openai_config,
             )
@@ -195,3 +400,9 @@ class LLMRouter(Generic[T]):
             )
 
         return router
+
+
+def _check_max_concurrent(max_concurrent: int) -> None:
+    # Semaphore(0) would block every request forever instead of failing.
+    if max_concurrent < 1:
+        raise ValueError(f"max_concurrent must be >= 1, got {max_concurrent}")
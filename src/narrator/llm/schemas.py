@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
@@ -65,6 +67,34 @@ class NarrativeSummaryResponse(BaseModel):
     )
 
 
+@lru_cache(maxsize=32)
+def response_json_schema(response_type: type[BaseModel]) -> dict[str, Any]:
+    """Return the JSON schema sent to providers that support schema-guided decoding.
+
+    The result is shared between calls and must be treated as read-only.
+
+    Args:
+        response_type: The expected response schema type
+
+    Returns:
+        The model's JSON schema
+    """
+    return response_type.model_json_schema()
+
+
+@lru_cache(maxsize=32)
+def schema_prompt_fragment(response_type: type[BaseModel]) -> str:
+    """Return the compact JSON schema text embedded in structured-output prompts.
+
+    Args:
+        response_type: The expected response schema type
+
+    Returns:
+        The model's JSON schema serialized without insignificant whitespace
+    """
+    return json.dumps(response_json_schema(response_type), separators=(",", ":"))
+
+
 def validate_structured_response(
     response_data: dict[str, Any], response_type: type[BaseModel]
 ) -> tuple[bool, BaseModel | None, str]:
@@ -84,3 +114,25 @@ def validate_structured_response(
         return False, None, f"validation failed: {e}"
     except Exception as e:
         return False, None, f"unexpected error: {e}"
+
+
+def validate_structured_response_json(
+    raw: str | bytes, response_type: type[BaseModel]
+) -> tuple[bool, BaseModel | None, str]:
+    """Parse and validate raw JSON text against the expected schema in one pass.
+
+    Args:
+        raw: The raw JSON response text
+        response_type: The expected response schema type
+
+    Returns:
+        A tuple of (is_valid, validated_model_or_none, error_message)
+    """
+    try:
+        validated = response_type.model_validate_json(raw)
+        return True, validated, ""
+    except ValidationError as e:
+        return False, None, f"validation failed: {e}"
+    except Exception as e:
+        return False, None, f"unexpected error: {e}"
+
@@ -1,9 +1,68 @@
 """Shared base class for domain models."""
 
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Any, TypeVar, Union, get_args, get_origin
+
 from pydantic import BaseModel, ConfigDict
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+ValueBuilder = Callable[[Any], Any]
+
 
 class DomainModel(BaseModel):
     """Immutable strict domain model."""
 
-    model_config = ConfigDict(extra="forbid", frozen=True)
+    model_config = ConfigDict(extra="forbid", frozen=True, defer_build=True)
+
+
+def construct_trusted(model_cls: type[ModelT], payload: dict[str, Any]) -> ModelT:
+    """Rebuild a model from a payload it already validated, skipping validation.
+
+    ``payload`` must come from ``model_dump()`` of a validated ``model_cls``
+    instance; nested models are rebuilt recursively via ``model_construct``.
+    Mutable leaves are copied, so rebuilt models never share state with a
+    cached payload.
+    """
+    values: dict[str, Any] = {}
+    for name, build in _construct_plan(model_cls):
+        if name not in payload:
+            continue
+        value = payload[name]
+        values[name] = None if value is None else build(value)
+    return model_cls.model_construct(**values)
+
+
+@lru_cache(maxsize=None)
+def _construct_plan(model_cls: type[BaseModel]) -> tuple[tuple[str, ValueBuilder], ...]:
+    return tuple((name, _value_builder(field.annotation)) for name, field in model_cls.model_fields.items())
+
+
+def _copy_mutable(value: Any) -> Any:
+    return copy.deepcopy(value) if isinstance(value, (dict, list, set)) else value
+
+
+def _value_builder(annotation: Any) -> ValueBuilder:
+    if _is_model(annotation):
+        return lambda value: construct_trusted(annotation, value)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin in (Union, UnionType):
+        members = [arg for arg in args if arg is not NoneType]
+        return _value_builder(members[0]) if len(members) == 1 else _copy_mutable
+    if origin is dict and len(args) == 2 and _is_model(args[1]):
+        item_model = args[1]
+        return lambda value: {key: construct_trusted(item_model, item) for key, item in value.items()}
+    if origin in (list, tuple) and args and _is_model(args[0]):
+        item_model = args[0]
+        container = tuple if origin is tuple else list
+        return lambda value: container(construct_trusted(item_model, item) for item in value)
+    return _copy_mutable
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
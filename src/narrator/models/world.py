@@ -28,29 +28,17 @@ class WorldState(DomainModel):
     phenology: PhenologyState = Field(default_factory=PhenologyState)
 
     @model_validator(mode="after")
-    def validate_character_keys(self) -> "WorldState":
+    def validate_keys(self) -> "WorldState":
         for key, character in self.characters.items():
             if key != character.id:
                 raise ValueError(f"character key mismatch: {key} != {character.id}")
-        return self
-
-    @model_validator(mode="after")
-    def validate_event_keys(self) -> "WorldState":
         for key, event in self.events.items():
             if key != event.id:
                 raise ValueError(f"event key mismatch: {key} != {event.id}")
-        return self
-
-    @model_validator(mode="after")
-    def validate_fact_keys(self) -> "WorldState":
         for key, fact in self.facts.items():
             fact_id = fact.get("id")
             if key != fact_id:
                 raise ValueError(f"fact key mismatch: {key} != {fact_id}")
-        return self
-
-    @model_validator(mode="after")
-    def validate_belief_keys(self) -> "WorldState":
         for key, beliefs in self.beliefs.items():
             for belief in beliefs:
                 character_id = belief.get("character_id")
@@ -52,16 +52,23 @@ def _resolve_ticks(args) -> tuple[int, ...]:
 async def _build_report(assembler: NarrativeAssembler, requested_ticks: tuple[int, ...], args) -> NarrativeReport:
     entries = []
     writer = None
+    router = None
     if not args.rules_only:
         app_config = load_config(args.config, args.env_file)
         router = LLMRouter.from_config(app_config.llm.model_dump(mode="python"))
         writer = NarrativeWriter(router, provider_name=args.provider)
 
-    ticks = _validate_requested_ticks(assembler, requested_ticks)
-    for tick in ticks:
-        beat = assembler.build_beat(tick)
-        entry = render_rule_entry(beat) if writer is None else await writer.write(beat)
-        entries.append(entry)
+    try:
+        ticks = _validate_requested_ticks(assembler, requested_ticks)
+        if writer is not None and len(ticks) > 1:
+            await writer.warmup()
+        for tick in ticks:
+            beat = assembler.build_beat(tick)
+            entry = render_rule_entry(beat) if writer is None else await writer.write(beat)
+            entries.append(entry)
+    finally:
+        if router is not None:
+            await router.aclose()
     return NarrativeReport(source=assembler.source, ticks=ticks, entries=tuple(entries))
 
 
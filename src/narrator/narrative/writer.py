@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from typing import Protocol
 
 from pydantic import BaseModel
@@ -12,6 +13,8 @@ from narrator.llm.schemas import NarrativeSummaryResponse
 
 from .models import NarrativeBeat, NarrativeEntry
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_TEMPERATURE = 0.3
 DEFAULT_MAX_TOKENS = 384
 
@@ -28,6 +31,8 @@ class StructuredNarrativeClient(Protocol):
         provider_name: str | None = None,
     ) -> BaseModel: ...
 
+    async def warmup(self, system_prompt: str, provider_name: str | None = None) -> None: ...
+
 
 class NarrativeWriter:
     def __init__(
@@ -42,6 +47,13 @@ class NarrativeWriter:
         self._temperature = temperature
         self._max_tokens = max_tokens
 
+    async def warmup(self) -> None:
+        """Prime the provider with the shared system prompt; failures are logged, not raised."""
+        try:
+            await self._llm_client.warmup(_system_prompt(), provider_name=self._provider_name)
+        except Exception:
+            logger.warning("narrative writer warmup failed; continuing without it", exc_info=True)
+
     async def write(self, beat: NarrativeBeat) -> NarrativeEntry:
         request = LLMRequest(
             system_prompt=_system_prompt(),
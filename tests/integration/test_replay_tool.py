@@ -43,6 +43,7 @@ def test_replay_cli_lists_and_diffs_records(tmp_path) -> None:
     assert "changed resources.food: 5.0 -> 4.0" in diff_result.stdout
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_controller_survives_1000_ticks_and_replays_from_checkpoint(tmp_path) -> None:
     continuous_db = SQLiteDatabase(tmp_path / "continuous.db")
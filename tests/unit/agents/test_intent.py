@@ -4,7 +4,17 @@ from pathlib import Path
 
 import pytest
 
-from narrator.agents.intent import IntentValidationError, load_action_whitelist, validate_intent
+from narrator.agents import intent as intent_module
+from narrator.agents.intent import (
+    ActionRule,
+    IntentValidationError,
+    clear_whitelist_cache,
+    load_action_whitelist,
+    validate_intent,
+    validate_intent_trusted,
+    validate_intents,
+)
+from narrator.file_cache import MAX_CACHED_FILES
 
 
 def test_validate_intent_success(tmp_path: Path) -> None:
@@ -63,6 +73,82 @@ def test_validate_intent_rejects_unknown_param(tmp_path: Path) -> None:
         )
 
 
+def test_validate_intent_trusted_matches_full_validation(tmp_path: Path) -> None:
+    whitelist = _write_whitelist(tmp_path)
+    payload = {
+        "character_id": "c-1",
+        "action_type": "move",
+        "parameters": {"destination": "village"},
+        "flavor_text": "他前往村庄。",
+    }
+    assert validate_intent_trusted(payload, whitelist) == validate_intent(payload, whitelist)
+
+
+def test_validate_intent_trusted_rejects_empty_text_field(tmp_path: Path) -> None:
+    whitelist = _write_whitelist(tmp_path)
+    with pytest.raises(IntentValidationError, match="intent payload validation failed: flavor_text"):
+        validate_intent_trusted(
+            {"character_id": "c-1", "action_type": "rest", "parameters": {}, "flavor_text": ""},
+            whitelist,
+        )
+
+
+def test_validate_intents_preserves_order_and_checks_each_intent(tmp_path: Path) -> None:
+    whitelist = _write_whitelist(tmp_path)
+    rest = {"character_id": "c-2", "action_type": "rest", "parameters": {}, "flavor_text": "休息"}
+    move = {"character_id": "c-1", "action_type": "move", "parameters": {"destination": "village"}, "flavor_text": "出发"}
+    intents = validate_intents([move, rest], whitelist)
+    assert [intent.character_id for intent in intents] == ["c-1", "c-2"]
+
+    with pytest.raises(IntentValidationError, match="missing required parameters: destination"):
+        validate_intents([rest, {**move, "parameters": {}}], whitelist)
+
+
+def test_load_action_whitelist_reuses_cached_instance_until_file_changes(tmp_path: Path) -> None:
+    clear_whitelist_cache()
+    first = _write_whitelist(tmp_path)
+    assert load_action_whitelist(tmp_path / "whitelist.yaml") is first
+
+    (tmp_path / "whitelist.yaml").write_text(
+        "version: 2\nactions:\n  rest:\n    optional_params: [duration_hours]\n",
+        encoding="utf-8",
+    )
+    reloaded = load_action_whitelist(tmp_path / "whitelist.yaml")
+    assert reloaded.version == 2
+    assert set(reloaded.actions) == {"rest"}
+
+    copy_path = tmp_path / "whitelist-copy.yaml"
+    copy_path.write_bytes((tmp_path / "whitelist.yaml").read_bytes())
+    copied = load_action_whitelist(copy_path)
+    assert copied == reloaded
+    assert isinstance(copied.actions["rest"], ActionRule)
+
+
+def test_action_rule_copy_recomputes_param_sets() -> None:
+    rule = ActionRule(required_params=("destination",), optional_params=("pace",))
+    assert rule.allowed_set == {"destination", "pace"}
+
+    copied = rule.model_copy(update={"required_params": ("target",)})
+
+    assert copied.required_set == {"target"}
+    assert copied.allowed_set == {"target", "pace"}
+    assert rule.required_set == {"destination"}
+
+
+def test_load_action_whitelist_cache_keeps_one_entry_per_path_and_is_bounded(tmp_path: Path) -> None:
+    clear_whitelist_cache()
+    _write_whitelist(tmp_path)
+    (tmp_path / "whitelist.yaml").write_text("version: 2\nactions:\n  rest: {}\n", encoding="utf-8")
+    load_action_whitelist(tmp_path / "whitelist.yaml")
+    assert len(intent_module._WHITELIST_CACHE) == 1
+
+    for index in range(MAX_CACHED_FILES + 4):
+        directory = tmp_path / f"rotated-{index}"
+        directory.mkdir()
+        _write_whitelist(directory)
+    assert len(intent_module._WHITELIST_CACHE) == MAX_CACHED_FILES
+
+
 def _write_whitelist(tmp_path: Path):
     content = """
 version: 1
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable
+
+import pytest
+from pydantic import BaseModel
+
+
+@pytest.fixture(scope="session")
+def result_fingerprint() -> Callable[[BaseModel], str]:
+    # Replay compares canonical JSON, so determinism is asserted on the same serialized form.
+    def fingerprint(result: BaseModel) -> str:
+        payload = json.dumps(result.model_dump(mode="json"), ensure_ascii=True, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    return fingerprint
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import pytest
+
+from narrator.models import Character, Granularity, StateMode, WorldState
+
+
+@pytest.fixture(scope="session")
+def sample_character() -> Character:
+    return Character(
+        id="c-1",
+        name="Alice",
+        state_mode=StateMode.ACTIVE,
+        location_id="loc-1",
+    )
+
+
+@pytest.fixture(scope="session")
+def base_world(sample_character: Character) -> WorldState:
+    # WorldState is frozen, so one validated instance (or a module-level baseline) is safe to share
+    # across tests, and variants only need shallow model_copy updates.
+    return WorldState(
+        tick=0,
+        seed=99,
+        granularity=Granularity.DAY,
+        characters={"c-1": sample_character},
+    )
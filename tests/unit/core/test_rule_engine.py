@@ -1,42 +1,26 @@
 from __future__ import annotations
 
-from narrator.core.rule_engine import RuleContext, RuleEngine
-from narrator.models import Character, Granularity, StateChange, StateMode, WorldState
+from collections.abc import Callable
+from dataclasses import dataclass
 
+import pytest
 
+from narrator.core.rule_engine import RuleContext, RuleEngine, RuleEngineResult
+from narrator.models import StateChange, WorldState
+
+
+@dataclass(slots=True, frozen=True)
 class StubRule:
-    def __init__(
-        self,
-        name: str,
-        priority: int,
-        matched: bool,
-        changes: tuple[StateChange, ...] = (),
-    ) -> None:
-        self.name = name
-        self.priority = priority
-        self._matched = matched
-        self._changes = changes
+    name: str
+    priority: int
+    matched: bool
+    changes: tuple[StateChange, ...] = ()
 
     def match(self, world: WorldState, context: RuleContext) -> bool:
-        return self._matched
+        return self.matched
 
     def apply(self, world: WorldState, context: RuleContext) -> tuple[StateChange, ...]:
-        return self._changes
-
-
-def _build_world() -> WorldState:
-    character = Character(
-        id="c-1",
-        name="Alice",
-        state_mode=StateMode.PASSIVE,
-        location_id="loc-1",
-    )
-    return WorldState(
-        tick=5,
-        seed=2026,
-        granularity=Granularity.DAY,
-        characters={"c-1": character},
-    )
+        return self.changes
 
 
 def _change(rule_name: str, before: int, after: int) -> StateChange:
@@ -48,33 +32,50 @@ def _change(rule_name: str, before: int, after: int) -> StateChange:
     )
 
 
-def test_rule_engine_orders_by_priority_then_registration() -> None:
-    engine = RuleEngine()
-    early = StubRule(name="early", priority=5, matched=True, changes=(_change("early", 1, 2),))
-    first = StubRule(name="first", priority=1, matched=True, changes=(_change("first", 0, 1),))
-    late = StubRule(name="late", priority=5, matched=True, changes=(_change("late", 2, 3),))
-    engine.register(early)
-    engine.register(first)
-    engine.register(late)
+@pytest.fixture
+def engine() -> RuleEngine:
+    return RuleEngine()
+
+
+@pytest.mark.parametrize(
+    ("rules", "expected"),
+    [
+        (
+            (
+                StubRule(name="early", priority=5, matched=True, changes=(_change("early", 1, 2),)),
+                StubRule(name="first", priority=1, matched=True, changes=(_change("first", 0, 1),)),
+                StubRule(name="late", priority=5, matched=True, changes=(_change("late", 2, 3),)),
+            ),
+            ["first", "early", "late"],
+        ),
+        (
+            (StubRule(name="stable", priority=1, matched=True, changes=(_change("stable", 3, 4),)),),
+            ["stable"],
+        ),
+    ],
+    ids=["priority_then_reg", "deterministic"],
+)
+def test_rule_engine_settles_in_priority_order_deterministically(
+    engine: RuleEngine,
+    base_world: WorldState,
+    rules: tuple[StubRule, ...],
+    expected: list[str],
+    result_fingerprint: Callable[[RuleEngineResult], str],
+) -> None:
+    for rule in rules:
+        engine.register(rule)
+    context = RuleContext(tick=6, seed=2026)
 
-    result = engine.settle(_build_world(), RuleContext(tick=6, seed=2026))
+    result = engine.settle(base_world, context)
 
-    assert [record.rule_name for record in result.audit_log] == ["first", "early", "late"]
-    assert [change.reason for change in result.state_changes] == ["first", "early", "late"]
+    assert [record.rule_name for record in result.audit_log] == expected
+    assert [change.reason for change in result.state_changes] == expected
+    assert result_fingerprint(engine.settle(base_world, context)) == result_fingerprint(result)
 
 
-def test_rule_engine_audits_unmatched_rule() -> None:
-    engine = RuleEngine()
+def test_rule_engine_audits_unmatched_rule(engine: RuleEngine, base_world: WorldState) -> None:
     engine.register(StubRule(name="noop", priority=0, matched=False))
-    result = engine.settle(_build_world(), RuleContext(tick=6, seed=2026))
+    result = engine.settle(base_world, RuleContext(tick=6, seed=2026))
     assert result.state_changes == ()
     assert result.audit_log[0].matched is False
     assert result.audit_log[0].state_change_count == 0
-
-
-def test_rule_engine_is_deterministic_for_same_input() -> None:
-    engine = RuleEngine()
-    engine.register(StubRule(name="stable", priority=1, matched=True, changes=(_change("stable", 3, 4),)))
-    world = _build_world()
-    context = RuleContext(tick=6, seed=2026)
-    assert engine.settle(world, context) == engine.settle(world, context)
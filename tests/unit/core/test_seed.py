@@ -1,22 +1,63 @@
 from __future__ import annotations
 
-from narrator.core.seed import SeedManager
+import hashlib
+import random
+import string
 
+import pytest
 
-def test_fork_is_stable_for_same_label() -> None:
-    manager = SeedManager(global_seed=123)
-    assert manager.fork("rule-engine") == manager.fork("rule-engine")
+from narrator.core.seed import SEED_VERSION_BLAKE2B, SEED_VERSION_SHA256, SeedManager
 
 
-def test_fork_differs_for_different_labels() -> None:
-    manager = SeedManager(global_seed=123)
-    assert manager.fork("clock") != manager.fork("event-pool")
+@pytest.mark.parametrize(
+    ("seed_a", "label_a", "seed_b", "label_b", "should_equal"),
+    [
+        (123, "rule-engine", 123, "rule-engine", True),
+        (123, "clock", 123, "event-pool", False),
+        (123, "rule", 456, "rule", False),
+    ],
+    ids=["same", "labels_differ", "seeds_differ"],
+)
+def test_fork_identity(seed_a: int, label_a: str, seed_b: int, label_b: str, should_equal: bool) -> None:
+    left = SeedManager(global_seed=seed_a).fork(label_a)
+    right = SeedManager(global_seed=seed_b).fork(label_b)
+    assert (left == right) is should_equal
 
 
-def test_fork_differs_for_different_global_seed() -> None:
-    left = SeedManager(global_seed=123).fork("rule")
-    right = SeedManager(global_seed=456).fork("rule")
-    assert left != right
+def _sampled_seed_labels(count: int = 200) -> list[tuple[int, str]]:
+    # A fixed generator keeps the sweep reproducible without a property-testing dependency.
+    sampler = random.Random(20260101)
+    alphabet = string.ascii_letters + string.digits + ":-_ é"
+    return [
+        (
+            sampler.randrange(-(2**63), 2**63),
+            "".join(sampler.choices(alphabet, k=sampler.randint(1, 32))),
+        )
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("seed_version", [SEED_VERSION_SHA256, SEED_VERSION_BLAKE2B])
+def test_fork_is_stable_and_distinct_across_sampled_inputs(seed_version: int) -> None:
+    samples = _sampled_seed_labels()
+    forks = {
+        (seed, label): SeedManager(global_seed=seed, seed_version=seed_version).fork(label)
+        for seed, label in samples
+    }
+    for (seed, label), forked in forks.items():
+        assert SeedManager(global_seed=seed, seed_version=seed_version).fork(label) == forked
+        assert 0 <= forked < 2**64
+    assert len(set(forks.values())) == len(forks)
+
+
+@pytest.mark.parametrize(
+    ("seed_version", "expected"),
+    [(SEED_VERSION_SHA256, 345855913431147314), (SEED_VERSION_BLAKE2B, 447306812779942316)],
+    ids=["sha256", "blake2b"],
+)
+def test_fork_matches_pinned_value(seed_version: int, expected: int) -> None:
+    # Distinct pinned values per version also pin that BLAKE2b never replays SHA-256 seeds.
+    assert SeedManager(global_seed=123, seed_version=seed_version).fork("rule") == expected
 
 
 def test_rng_sequence_is_reproducible() -> None:
@@ -24,3 +65,28 @@ def test_rng_sequence_is_reproducible() -> None:
     rng_a = manager.rng("dm-agent")
     rng_b = manager.rng("dm-agent")
     assert [rng_a.random() for _ in range(3)] == [rng_b.random() for _ in range(3)]
+
+
+def test_fork_reuses_memoized_seed_and_rng_restarts_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    digests: list[bytes] = []
+    real_sha256 = hashlib.sha256
+
+    def counting_sha256(data: bytes):
+        digests.append(data)
+        return real_sha256(data)
+
+    monkeypatch.setattr(hashlib, "sha256", counting_sha256)
+    manager = SeedManager(global_seed=2026)
+    assert manager.fork("dm-agent") == manager.fork("dm-agent")
+    assert digests == [b"2026:dm-agent"]
+
+    rng_a = manager.rng("dm-agent")
+    rng_b = manager.rng("dm-agent")
+    assert rng_a is not rng_b
+    assert [rng_a.random() for _ in range(3)] == [rng_b.random() for _ in range(3)]
+    assert len(digests) == 1
+
+
+def test_unknown_seed_version_rejected() -> None:
+    with pytest.raises(ValueError, match="unsupported seed_version"):
+        SeedManager(global_seed=123, seed_version=99)
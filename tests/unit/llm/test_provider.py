@@ -2,222 +2,606 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Callable
+from typing import Any
+
+import httpx
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from narrator.llm.base import (
+    HTTPProvider,
     LLMRequest,
     LLMResponse,
     ProviderError,
     ProviderValidationError,
 )
+from narrator.llm.anthropic import AnthropicProvider
+from narrator.llm.ollama import OllamaProvider
+from narrator.llm.openai import OpenAIProvider
 from narrator.llm.schemas import (
     DecisionResponse,
     HealthCheckResponse,
     IntentResponse,
     StructuredResponse,
+    response_json_schema,
+    schema_prompt_fragment,
     validate_structured_response,
+    validate_structured_response_json,
 )
 
 
 # --- Schema Tests ---
 
-def test_structured_response_valid() -> None:
-    """Test valid StructuredResponse creation."""
-    response = StructuredResponse(content="Test content")
-    assert response.content == "Test content"
+@pytest.mark.parametrize(
+    ("model_cls", "kwargs", "expected"),
+    [
+        (StructuredResponse, {"content": "Test content"}, {"content": "Test content"}),
+        (
+            IntentResponse,
+            {"intent": "move", "flavor_text": "The character moves forward", "parameters": {"target": "north"}},
+            {"intent": "move", "flavor_text": "The character moves forward", "parameters": {"target": "north"}},
+        ),
+        (IntentResponse, {"intent": "rest", "flavor_text": "Resting..."}, {"intent": "rest", "parameters": {}}),
+        (
+            DecisionResponse,
+            {"verdict": "ACCEPT", "reason": "Action is valid", "outcome": {"success": True}},
+            {"verdict": "ACCEPT", "reason": "Action is valid", "outcome": {"success": True}},
+        ),
+        (HealthCheckResponse, {"healthy": True, "message": "OK"}, {"healthy": True, "message": "OK"}),
+        (HealthCheckResponse, {"healthy": True}, {"healthy": True, "message": ""}),
+    ],
+    ids=[
+        "structured_valid",
+        "intent_valid",
+        "intent_minimal",
+        "decision_valid",
+        "health_valid",
+        "health_default_message",
+    ],
+)
+def test_model_valid(model_cls: type[BaseModel], kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
+    """Test valid response model creation and defaults."""
+    response = model_cls(**kwargs)
+    for name, value in expected.items():
+        assert getattr(response, name) == value
 
 
-def test_structured_response_extra_field_rejected() -> None:
-    """Test that extra fields are rejected."""
-    with pytest.raises(ValidationError):
-        StructuredResponse(
-            content="Test",
-            extra_field="should fail",
-        )
+def _assign_content(response: StructuredResponse) -> None:
+    response.content = "Modified"
 
 
-def test_structured_response_frozen() -> None:
-    """Test that StructuredResponse is frozen."""
-    response = StructuredResponse(content="Test")
+@pytest.mark.parametrize(
+    "build",
+    [
+        lambda: StructuredResponse(content="Test", extra_field="should fail"),
+        lambda: _assign_content(StructuredResponse(content="Test")),
+    ],
+    ids=["extra_field_rejected", "frozen"],
+)
+def test_model_rejects_invalid(build: Callable[[], object]) -> None:
+    """Test that extra fields and mutation are rejected."""
     with pytest.raises(ValidationError):
-        response.content = "Modified"
+        build()
 
 
-def test_intent_response_valid() -> None:
-    """Test valid IntentResponse creation."""
-    response = IntentResponse(
-        intent="move",
-        flavor_text="The character moves forward",
-        parameters={"target": "north"},
+# --- Validation Tests ---
+
+@pytest.mark.parametrize(
+    ("data", "model_cls", "expected_attrs", "err_substr"),
+    [
+        ({"content": "Test"}, StructuredResponse, {"content": "Test"}, None),
+        ({}, StructuredResponse, None, "validation failed"),
+        ({"content": 123}, StructuredResponse, None, "validation failed"),
+        (
+            {"intent": "travel", "flavor_text": "Traveling to the city", "parameters": {"destination": "city"}},
+            IntentResponse,
+            {"intent": "travel"},
+            None,
+        ),
+        ({"verdict": "REJECT", "reason": "Invalid action"}, DecisionResponse, {"verdict": "REJECT"}, None),
+    ],
+    ids=["success", "missing_field", "wrong_type", "intent_success", "decision_success"],
+)
+def test_validate_structured_response(
+    data: dict[str, Any],
+    model_cls: type[BaseModel],
+    expected_attrs: dict[str, Any] | None,
+    err_substr: str | None,
+) -> None:
+    """Test validation of decoded response data against a schema."""
+    is_valid, validated, error_msg = validate_structured_response(data, model_cls)
+    if err_substr is None:
+        assert is_valid is True
+        assert validated is not None
+        assert error_msg == ""
+        for name, value in expected_attrs.items():
+            assert getattr(validated, name) == value
+    else:
+        assert is_valid is False
+        assert validated is None
+        assert err_substr in error_msg
+
+
+def test_validate_structured_response_json() -> None:
+    """Test one-pass parsing and validation of raw JSON text."""
+    is_valid, validated, _ = validate_structured_response_json(
+        b'{"verdict": "ACCEPT", "reason": "ok"}', DecisionResponse
     )
-    assert response.intent == "move"
-    assert response.flavor_text == "The character moves forward"
-    assert response.parameters == {"target": "north"}
+    assert is_valid is True
+    assert validated == DecisionResponse(verdict="ACCEPT", reason="ok")
 
+    is_valid, validated, error_msg = validate_structured_response_json("{not json", DecisionResponse)
+    assert is_valid is False
+    assert validated is None
+    assert "validation failed" in error_msg
 
-def test_intent_response_minimal() -> None:
-    """Test IntentResponse with minimal parameters."""
-    response = IntentResponse(
-        intent="rest",
-        flavor_text="Resting...",
-    )
-    assert response.intent == "rest"
-    assert response.parameters == {}
 
+def test_schema_prompt_fragment_is_compact_and_cached() -> None:
+    """Test that the schema prompt text is compact JSON reused per response type."""
+    fragment = schema_prompt_fragment(IntentResponse)
+    assert json.loads(fragment) == IntentResponse.model_json_schema()
+    assert ", " not in fragment and ": " not in fragment
+    assert schema_prompt_fragment(IntentResponse) is fragment
 
-def test_decision_response_valid() -> None:
-    """Test valid DecisionResponse creation."""
-    response = DecisionResponse(
-        verdict="ACCEPT",
-        reason="Action is valid",
-        outcome={"success": True},
-    )
-    assert response.verdict == "ACCEPT"
-    assert response.reason == "Action is valid"
-    assert response.outcome == {"success": True}
 
+# --- LLM Request/Response Tests ---
 
-def test_health_check_response_valid() -> None:
-    """Test valid HealthCheckResponse creation."""
-    response = HealthCheckResponse(healthy=True, message="OK")
-    assert response.healthy is True
-    assert response.message == "OK"
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        (
+            {"system_prompt": "You are helpful", "user_prompt": "Hello"},
+            {
+                "system_prompt": "You are helpful",
+                "user_prompt": "Hello",
+                "temperature": 0.7,
+                "max_tokens": 1024,
+                "top_p": 1.0,
+                "include_raw": False,
+            },
+        ),
+        (
+            {
+                "system_prompt": "Be creative",
+                "user_prompt": "Write a story",
+                "temperature": 0.9,
+                "max_tokens": 2048,
+                "top_p": 0.95,
+            },
+            {"temperature": 0.9, "max_tokens": 2048, "top_p": 0.95},
+        ),
+    ],
+    ids=["defaults", "custom_values"],
+)
+def test_llm_request_fields(kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
+    """Test LLMRequest defaults and overrides."""
+    request = LLMRequest(**kwargs)
+    for name, value in expected.items():
+        assert getattr(request, name) == value
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        (
+            {"content": "Hello world", "model": "gpt-4"},
+            {"content": "Hello world", "model": "gpt-4", "usage": {}, "raw_response": None},
+        ),
+        (
+            {
+                "content": "Response text",
+                "model": "claude-3",
+                "usage": {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+            },
+            {"usage": {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30}},
+        ),
+    ],
+    ids=["minimal", "with_usage"],
+)
+def test_llm_response_fields(kwargs: dict[str, Any], expected: dict[str, Any]) -> None:
+    """Test LLMResponse defaults and token usage."""
+    response = LLMResponse(**kwargs)
+    for name, value in expected.items():
+        assert getattr(response, name) == value
 
 
-def test_health_check_response_default_message() -> None:
-    """Test HealthCheckResponse with default message."""
-    response = HealthCheckResponse(healthy=True)
-    assert response.healthy is True
-    assert response.message == ""
+# --- Provider Base Tests ---
 
+def test_provider_validation_error() -> None:
+    """Test ProviderValidationError creation."""
+    error = ProviderValidationError("Schema validation failed")
+    assert str(error) == "Schema validation failed"
 
-# --- Validation Tests ---
 
-def test_validate_structured_response_success() -> None:
-    """Test successful validation."""
-    data = {"content": "Test"}
-    is_valid, validated, error_msg = validate_structured_response(
-        data, StructuredResponse
-    )
-    assert is_valid is True
-    assert validated is not None
-    assert validated.content == "Test"
-    assert error_msg == ""
+def test_provider_error_base() -> None:
+    """Test base ProviderError."""
+    error = ProviderError("Something went wrong")
+    assert str(error) == "Something went wrong"
 
 
-def test_validate_structured_response_missing_field() -> None:
-    """Test validation with missing required field."""
-    data = {}
-    is_valid, validated, error_msg = validate_structured_response(
-        data, StructuredResponse
-    )
-    assert is_valid is False
-    assert validated is None
-    assert "validation failed" in error_msg
+# --- HTTP Client Tests ---
 
+@pytest.mark.asyncio
+async def test_provider_reuses_pooled_client_until_closed() -> None:
+    """Test that one pooled client serves every call and is closed by aclose."""
+    seen_ports: list[int | None] = []
 
-def test_validate_structured_response_wrong_type() -> None:
-    """Test validation with wrong type."""
-    data = {"content": 123}  # content should be string
-    is_valid, validated, error_msg = validate_structured_response(
-        data, StructuredResponse
-    )
-    assert is_valid is False
-    assert validated is None
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_ports.append(request.url.port)
+        if request.url.path == "/api/tags":
+            return httpx.Response(200, json={"models": []})
+        return httpx.Response(200, json={"response": "ok", "prompt_eval_count": 1, "eval_count": 2})
 
+    transport = httpx.MockTransport(handler)
+    async with OllamaProvider(model="llama3", transport=transport) as provider:
+        assert (await provider.health_check()).healthy is True
+        first = await provider.complete(LLMRequest(system_prompt="sys", user_prompt="a"))
+        second = await provider.complete(LLMRequest(system_prompt="sys", user_prompt="b"))
 
-def test_validate_intent_response_success() -> None:
-    """Test IntentResponse validation."""
-    data = {
-        "intent": "travel",
-        "flavor_text": "Traveling to the city",
-        "parameters": {"destination": "city"},
-    }
-    is_valid, validated, error_msg = validate_structured_response(
-        data, IntentResponse
-    )
-    assert is_valid is True
-    assert validated is not None
-    assert validated.intent == "travel"
-
-
-def test_validate_decision_response_success() -> None:
-    """Test DecisionResponse validation."""
-    data = {
-        "verdict": "REJECT",
-        "reason": "Invalid action",
-    }
-    is_valid, validated, error_msg = validate_structured_response(
-        data, DecisionResponse
-    )
-    assert is_valid is True
-    assert validated is not None
-    assert validated.verdict == "REJECT"
+    assert first.content == second.content == "ok"
+    assert first.usage["total_tokens"] == 3
+    assert seen_ports == [11434, 11434, 11434]
+    with pytest.raises(ProviderError):
+        await provider.complete(LLMRequest(system_prompt="sys", user_prompt="c"))
 
 
-# --- LLM Request/Response Tests ---
+@pytest.mark.asyncio
+async def test_ollama_structured_sends_schema_as_format() -> None:
+    """Test that structured Ollama calls constrain decoding with the response schema."""
+    payloads: list[dict] = []
 
-def test_llm_request_defaults() -> None:
-    """Test LLMRequest default values."""
-    request = LLMRequest(
-        system_prompt="You are helpful",
-        user_prompt="Hello",
-    )
-    assert request.system_prompt == "You are helpful"
-    assert request.user_prompt == "Hello"
-    assert request.temperature == 0.7
-    assert request.max_tokens == 1024
-    assert request.top_p == 1.0
-
-
-def test_llm_request_custom_values() -> None:
-    """Test LLMRequest with custom values."""
-    request = LLMRequest(
-        system_prompt="Be creative",
-        user_prompt="Write a story",
-        temperature=0.9,
-        max_tokens=2048,
-        top_p=0.95,
-    )
-    assert request.temperature == 0.9
-    assert request.max_tokens == 2048
-    assert request.top_p == 0.95
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        body = {"intent": "move", "flavor_text": "walks north", "parameters": {"to": "north"}}
+        return httpx.Response(200, json={"response": json.dumps(body)})
 
+    async with OllamaProvider(model="llama3", transport=httpx.MockTransport(handler)) as provider:
+        result = await provider.complete_structured(
+            LLMRequest(system_prompt="sys", user_prompt="act"), IntentResponse
+        )
 
-def test_llm_response_minimal() -> None:
-    """Test LLMResponse with minimal values."""
-    response = LLMResponse(
-        content="Hello world",
-        model="gpt-4",
-    )
-    assert response.content == "Hello world"
-    assert response.model == "gpt-4"
-    assert response.usage == {}
+    assert result.intent == "move"
+    assert payloads[0]["format"] == response_json_schema(IntentResponse)
+    assert payloads[0]["prompt"] == "act"
+
+
+@pytest.mark.asyncio
+async def test_warmup_only_calls_prefix_caching_providers() -> None:
+    """Test that warmup issues a one-token call to Ollama and nothing to hosted APIs."""
+    payloads: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, json={"response": "", "prompt_eval_count": 1, "eval_count": 1})
+
+    transport = httpx.MockTransport(handler)
+    async with OpenAIProvider(model="gpt-4", api_key="sk-test", transport=transport) as provider:
+        await provider.warmup("shared system prompt")
+    assert payloads == []
+
+    async with OllamaProvider(model="llama3", transport=transport) as provider:
+        await provider.warmup("shared system prompt")
+    assert len(payloads) == 1
+    assert payloads[0]["system"] == "shared system prompt"
+    assert payloads[0]["options"]["temperature"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_openai_provider_maps_response_and_errors() -> None:
+    """Test the shared HTTP core against the OpenAI wire format."""
+    statuses = iter([200, 401])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/chat/completions"
+        assert request.headers["Authorization"] == "Bearer sk-test"
+        body = {
+            "choices": [{"message": {"content": "hello"}}],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 1, "total_tokens": 4},
+        }
+        return httpx.Response(next(statuses), json=body)
+
+    request = LLMRequest(system_prompt="sys", user_prompt="hi")
+    async with OpenAIProvider(
+        model="gpt-4", api_key="sk-test", transport=httpx.MockTransport(handler)
+    ) as provider:
+        response = await provider.complete(request)
+        with pytest.raises(ProviderError, match="API error: 401"):
+            await provider.complete(request)
+
+    assert response.content == "hello"
+    assert response.usage["total_tokens"] == 4
     assert response.raw_response is None
 
 
-def test_llm_response_with_usage() -> None:
-    """Test LLMResponse with token usage."""
-    response = LLMResponse(
-        content="Response text",
-        model="claude-3",
-        usage={"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30},
+def _ollama(transport: httpx.MockTransport) -> HTTPProvider:
+    return OllamaProvider(model="llama3", transport=transport)
+
+
+def _openai(transport: httpx.MockTransport) -> HTTPProvider:
+    return OpenAIProvider(model="gpt-4", api_key="sk-test", transport=transport)
+
+
+def _anthropic(transport: httpx.MockTransport) -> HTTPProvider:
+    return AnthropicProvider(model="claude", api_key="ak-test", transport=transport)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("make_provider", "body"),
+    [
+        (_ollama, [1]),
+        (_ollama, "text"),
+        (_openai, [1]),
+        (_openai, {"choices": "x"}),
+        (_anthropic, [1]),
+        (_anthropic, {"content": []}),
+        (_anthropic, {"content": "x"}),
+    ],
+    ids=[
+        "ollama_list",
+        "ollama_string",
+        "openai_list",
+        "openai_wrong_shape",
+        "anthropic_list",
+        "anthropic_empty_content",
+        "anthropic_wrong_shape",
+    ],
+)
+async def test_provider_maps_malformed_bodies_to_provider_error(
+    make_provider: Callable[[httpx.MockTransport], HTTPProvider], body: Any
+) -> None:
+    """Test that a decodable body of the wrong shape surfaces as ProviderError."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+    request = LLMRequest(system_prompt="sys", user_prompt="hi")
+    async with make_provider(transport) as provider:
+        with pytest.raises(ProviderError, match="unexpected error"):
+            await provider.complete(request)
+        with pytest.raises(ProviderError, match="unexpected error"):
+            await provider.complete_structured(request, IntentResponse)
+
+
+@pytest.mark.asyncio
+async def test_anthropic_provider_maps_messages_request_and_response() -> None:
+    """Test the shared HTTP core against the Anthropic messages wire format."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        body = {
+            "content": [{"type": "text", "text": "hello"}],
+            "usage": {"input_tokens": 3, "output_tokens": 1},
+        }
+        return httpx.Response(200, json=body)
+
+    async with AnthropicProvider(
+        model="claude", api_key="ak-test", transport=httpx.MockTransport(handler)
+    ) as provider:
+        response = await provider.complete(LLMRequest(system_prompt="sys", user_prompt="hi", max_tokens=16))
+
+    assert response.content == "hello"
+    assert response.usage == {"input_tokens": 3, "output_tokens": 1}
+    request = seen[0]
+    assert request.url.path == "/v1/messages"
+    assert request.headers["x-api-key"] == "ak-test"
+    assert request.headers["anthropic-version"] == "2023-06-01"
+    payload = json.loads(request.content)
+    assert payload["system"] == "sys"
+    assert payload["messages"] == [{"role": "user", "content": "hi"}]
+    assert payload["max_tokens"] == 16
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("status", "healthy"), [(200, True), (429, True), (500, False)])
+async def test_anthropic_health_probe_treats_rate_limits_as_healthy(status: int, healthy: bool) -> None:
+    """Test that the Anthropic probe POSTs a one-token message and accepts 200 and 429."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(status, json={})
+
+    async with AnthropicProvider(
+        model="claude", api_key="ak-test", transport=httpx.MockTransport(handler)
+    ) as provider:
+        result = await provider.health_check()
+
+    assert result.healthy is healthy
+    assert seen[0].method == "POST"
+    assert seen[0].url.path == "/v1/messages"
+    assert json.loads(seen[0].content)["max_tokens"] == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_keeps_raw_response_only_when_requested() -> None:
+    """Test that the decoded provider body is attached only for include_raw requests."""
+    body = {"response": "ok", "prompt_eval_count": 1, "eval_count": 1}
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+
+    async with OllamaProvider(model="llama3", transport=transport) as provider:
+        response = await provider.complete(LLMRequest(user_prompt="a", include_raw=True))
+
+    assert response.raw_response == body
+
+
+@pytest.mark.asyncio
+async def test_provider_retries_transient_statuses_only() -> None:
+    """Test that 429/5xx are retried up to max_retries while other 4xx fail fast."""
+    statuses = [429, 503, 200, 400]
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses[len(calls)]
+        calls.append(status)
+        return httpx.Response(status, headers={"Retry-After": "0"}, json={"response": "ok"})
+
+    async with OllamaProvider(
+        model="llama3", max_retries=2, retry_backoff=0.0, transport=httpx.MockTransport(handler)
+    ) as provider:
+        response = await provider.complete(LLMRequest(system_prompt="sys", user_prompt="a"))
+        with pytest.raises(ProviderError, match="API error: 400"):
+            await provider.complete(LLMRequest(system_prompt="sys", user_prompt="b"))
+
+    assert response.content == "ok"
+    assert calls == [429, 503, 200, 400]
+
+
+@pytest.mark.asyncio
+async def test_provider_max_retries_zero_makes_one_attempt_and_negative_is_rejected() -> None:
+    """Test the lower bound of max_retries."""
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(503)
+        return httpx.Response(503, json={})
+
+    async with OllamaProvider(model="llama3", max_retries=0, transport=httpx.MockTransport(handler)) as provider:
+        with pytest.raises(ProviderError, match="API error: 503"):
+            await provider.complete(LLMRequest(system_prompt="sys", user_prompt="a"))
+    assert calls == [503]
+
+    with pytest.raises(ValueError, match="max_retries must be >= 0"):
+        OllamaProvider(model="llama3", max_retries=-1)
+
+
+@pytest.mark.asyncio
+async def test_providers_stream_content_fragments() -> None:
+    """Test incremental parsing of Ollama NDJSON and OpenAI server-sent events."""
+    ndjson = b'{"response": "Hel"}\n{"response": "lo"}\n{"response": "", "done": true}\n'
+    sse = (
+        b'data: {"choices": [{"delta": {"role": "assistant"}}]}\n\n'
+        b'data: {"choices": [{"delta": {"content": "Hel"}}]}\n\n'
+        b'data: {"choices": [{"delta": {"content": "lo"}}]}\n\n'
+        b"data: [DONE]\n\n"
     )
-    assert response.usage["prompt_tokens"] == 10
-    assert response.usage["completion_tokens"] == 20
-    assert response.usage["total_tokens"] == 30
+    bodies: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, content=sse if request.url.path.endswith("/completions") else ndjson)
+
+    request = LLMRequest(system_prompt="sys", user_prompt="hi")
+    transport = httpx.MockTransport(handler)
+    async with OllamaProvider(model="llama3", transport=transport) as ollama:
+        ollama_chunks = [chunk async for chunk in ollama.complete_stream(request)]
+    async with OpenAIProvider(model="gpt-4", api_key="sk", transport=transport) as openai:
+        openai_chunks = [chunk async for chunk in openai.complete_stream(request)]
+
+    assert ollama_chunks == openai_chunks == ["Hel", "lo"]
+    assert all(body["stream"] is True for body in bodies)
+
+
+@pytest.mark.asyncio
+async def test_anthropic_streams_content_block_deltas() -> None:
+    """Test that Anthropic SSE yields only text deltas and skips the other event types."""
+    sse = (
+        b"event: message_start\n"
+        b'data: {"type": "message_start", "message": {"id": "m"}}\n\n'
+        b'data: {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}}\n\n'
+        b"event: ping\n"
+        b'data: {"type": "ping"}\n\n'
+        b'data: {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hel"}}\n\n'
+        b'data: {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "lo"}}\n\n'
+        b'data: {"type": "content_block_stop", "index": 0}\n\n'
+        b'data: {"type": "message_stop"}\n\n'
+    )
+    bodies: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, content=sse)
+
+    request = LLMRequest(system_prompt="sys", user_prompt="hi")
+    async with _anthropic(httpx.MockTransport(handler)) as provider:
+        chunks = [chunk async for chunk in provider.complete_stream(request)]
+
+    assert chunks == ["Hel", "lo"]
+    assert bodies[0]["stream"] is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("make_provider", "body"),
+    [
+        (_ollama, b'{"response": "Hel"}\n{"error": "model runner crashed"}\n'),
+        (
+            _anthropic,
+            b'data: {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hel"}}\n\n'
+            b'event: error\ndata: {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}}\n\n',
+        ),
+    ],
+    ids=["ollama", "anthropic"],
+)
+async def test_provider_stream_raises_on_error_frames(make_provider, body: bytes) -> None:
+    """Test that a mid-stream error frame surfaces as ProviderError instead of a truncated reply."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
 
+    chunks: list[str] = []
+    async with make_provider(transport) as provider:
+        with pytest.raises(ProviderError, match="stream error"):
+            async for chunk in provider.complete_stream(LLMRequest(system_prompt="sys", user_prompt="hi")):
+                chunks.append(chunk)
 
-# --- Provider Base Tests ---
+    assert chunks == ["Hel"]
 
-def test_provider_validation_error() -> None:
-    """Test ProviderValidationError creation."""
-    error = ProviderValidationError("Schema validation failed")
-    assert str(error) == "Schema validation failed"
 
+@pytest.mark.asyncio
+async def test_structured_stream_validates_once_json_closes() -> None:
+    """Test that streamed structured output is reassembled and validated at the closing brace."""
+    pieces = ['{"verdict": ', '"ACCEPT", "outcome": {}', ', "reason": "ok"}', "  "]
+    ndjson = "".join(json.dumps({"response": piece}) + "\n" for piece in pieces).encode()
 
-def test_provider_error_base() -> None:
-    """Test base ProviderError."""
-    error = ProviderError("Something went wrong")
-    assert str(error) == "Something went wrong"
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, content=ndjson)
+
+    async with OllamaProvider(model="llama3", transport=httpx.MockTransport(handler)) as provider:
+        result = await provider.complete_structured_streamed(
+            LLMRequest(system_prompt="sys", user_prompt="judge"), DecisionResponse
+        )
+
+    assert result == DecisionResponse(verdict="ACCEPT", reason="ok", outcome={})
+
+
+@pytest.mark.asyncio
+async def test_openai_batches_prompts_that_share_a_system_prompt() -> None:
+    """Test that batch-capable endpoints receive one multi-prompt /completions call."""
+    posted: list[tuple[str, dict]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        posted.append((request.url.path, body))
+        choices = [{"index": i, "text": f"out-{i}"} for i in range(len(body["prompt"]))]
+        return httpx.Response(200, json={"choices": list(reversed(choices))})
+
+    requests = [LLMRequest(system_prompt="sys", user_prompt=p) for p in ("a", "b")]
+    async with OpenAIProvider(
+        model="m", api_key="k", supports_batch_prompts=True, transport=httpx.MockTransport(handler)
+    ) as provider:
+        assert provider.can_batch(requests)
+        assert not provider.can_batch([requests[0], LLMRequest(system_prompt="other")])
+        responses = await provider.complete_batch(requests)
+
+    assert [r.content for r in responses] == ["out-0", "out-1"]
+    assert posted == [("/v1/completions", posted[0][1])]
+    assert posted[0][1]["prompt"] == ["sys\n\na", "sys\n\nb"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body",
+    [{}, {"choices": [{"text": "a"}, {"text": "b"}]}, {"choices": [{"index": 0}, {"index": 1}]}, {"choices": None}],
+    ids=["no_choices", "no_index", "no_text", "choices_not_list"],
+)
+async def test_openai_batch_maps_malformed_bodies_to_provider_error(body: dict) -> None:
+    """Test that a malformed batch body surfaces as ProviderError like single completions."""
+    requests = [LLMRequest(system_prompt="sys", user_prompt=p) for p in ("a", "b")]
+    async with OpenAIProvider(
+        model="m",
+        api_key="k",
+        supports_batch_prompts=True,
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body)),
+    ) as provider:
+        with pytest.raises(ProviderError, match="unexpected error"):
+            await provider.complete_batch(requests)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+
 import pytest
 
 from narrator.llm.base import LLMProvider, LLMRequest, LLMResponse, ProviderError
@@ -9,6 +12,12 @@ from narrator.llm.router import LLMRouter, ProviderNotConfiguredError, RouterErr
 from narrator.llm.schemas import HealthCheckResponse, IntentResponse, StructuredResponse
 
 
+pytestmark = pytest.mark.llm_unit
+
+# Parametrize the generic router once and reuse the alias across tests.
+StructuredRouter = LLMRouter[StructuredResponse]
+
+
 # Mock provider for testing
 class MockProvider(LLMProvider[StructuredResponse]):
     """Mock provider for testing router functionality."""
@@ -17,6 +26,7 @@ class MockProvider(LLMProvider[StructuredResponse]):
         super().__init__(model, **kwargs)
         self._health_healthy = True
         self._health_message = "OK"
+        self._responses: dict[LLMRequest, LLMResponse] = {}
 
     def set_health(self, healthy: bool, message: str = "") -> None:
         self._health_healthy = healthy
@@ -28,10 +38,15 @@ class MockProvider(LLMProvider[StructuredResponse]):
         )
 
     async def complete(self, request: LLMRequest) -> LLMResponse:
-        return LLMResponse(
-            content=f"Mock response from {self._model}",
-            model=self._model,
-        )
+        # Requests are frozen dataclasses, so identical requests replay one response.
+        response = self._responses.get(request)
+        if response is None:
+            response = LLMResponse(
+                content=f"Mock response from {self._model}",
+                model=self._model,
+            )
+            self._responses[request] = response
+        return response
 
     async def complete_structured(
         self, request: LLMRequest, response_type: type[StructuredResponse]
@@ -39,42 +54,77 @@ class MockProvider(LLMProvider[StructuredResponse]):
         return response_type(content=f"Mock structured response from {self._model}")
 
 
-# --- Router Basic Tests ---
+MockProviderFactory = Callable[..., MockProvider]
 
-def test_router_initialization_default() -> None:
-    """Test router with default provider."""
-    router = LLMRouter[StructuredResponse]()
-    assert router._default_provider_name == "openai"
-    assert router.available_providers == []
 
+@pytest.fixture
+def make_mock_provider() -> MockProviderFactory:
+    def _make(model: str = "mock-model", healthy: bool = True, message: str = "OK") -> MockProvider:
+        provider = MockProvider(model)
+        provider.set_health(healthy, message)
+        return provider
 
-def test_router_initialization_custom() -> None:
-    """Test router with custom default provider."""
-    router = LLMRouter[StructuredResponse](default_provider_name="anthropic")
-    assert router._default_provider_name == "anthropic"
+    return _make
 
 
-def test_router_register_provider() -> None:
+# --- Router Basic Tests ---
+
+@pytest.mark.parametrize(
+    ("initial", "registered", "set_to", "expected"),
+    [
+        ("openai", (), None, "openai"),
+        ("anthropic", (), None, "anthropic"),
+        ("openai", ("provider1", "provider2"), "provider2", "provider2"),
+        ("openai", (), "nonexistent", ProviderNotConfiguredError),
+    ],
+    ids=["default", "custom", "set_default", "set_default_not_registered"],
+)
+def test_router_default_provider(
+    make_mock_provider: MockProviderFactory,
+    initial: str,
+    registered: tuple[str, ...],
+    set_to: str | None,
+    expected: str | type[Exception],
+) -> None:
+    """Test the initial default provider and switching it with set_default_provider."""
+    router = StructuredRouter(default_provider_name=initial)
+    providers = {name: make_mock_provider(name) for name in registered}
+    for name, provider in providers.items():
+        router.register_provider(name, provider, {})
+
+    if isinstance(expected, type):
+        with pytest.raises(expected):
+            router.set_default_provider(set_to)
+        return
+
+    if set_to is not None:
+        router.set_default_provider(set_to)
+    assert router._default_provider_name == expected
+    assert router.available_providers == list(registered)
+    if expected in providers:
+        assert router.default_provider is providers[expected]
+
+
+def test_router_register_provider(make_mock_provider: MockProviderFactory) -> None:
     """Test registering a provider."""
-    router = LLMRouter[StructuredResponse]()
-    provider = MockProvider()
-    router.register_provider("mock", provider, {})
+    router = StructuredRouter()
+    router.register_provider("mock", make_mock_provider(), {})
     assert "mock" in router.available_providers
 
 
-def test_router_get_provider_by_name() -> None:
+def test_router_get_provider_by_name(make_mock_provider: MockProviderFactory) -> None:
     """Test getting a provider by name."""
-    router = LLMRouter[StructuredResponse]()
-    provider = MockProvider()
+    router = StructuredRouter()
+    provider = make_mock_provider()
     router.register_provider("mock", provider, {})
     retrieved = router.get_provider("mock")
     assert retrieved is provider
 
 
-def test_router_get_default_provider() -> None:
+def test_router_get_default_provider(make_mock_provider: MockProviderFactory) -> None:
     """Test getting the default provider."""
-    router = LLMRouter[StructuredResponse](default_provider_name="mock")
-    provider = MockProvider()
+    router = StructuredRouter(default_provider_name="mock")
+    provider = make_mock_provider()
     router.register_provider("mock", provider, {})
     retrieved = router.default_provider
     assert retrieved is provider
@@ -82,95 +132,133 @@ def test_router_get_default_provider() -> None:
 
 def test_router_get_provider_not_configured() -> None:
     """Test getting a non-configured provider raises error."""
-    router = LLMRouter[StructuredResponse]()
+    router = StructuredRouter()
     with pytest.raises(ProviderNotConfiguredError):
         router.get_provider("nonexistent")
 
 
-def test_router_set_default_provider() -> None:
-    """Test setting the default provider."""
-    router = LLMRouter[StructuredResponse]()
-    provider1 = MockProvider("model1")
-    provider2 = MockProvider("model2")
-    router.register_provider("provider1", provider1, {})
-    router.register_provider("provider2", provider2, {})
-    router.set_default_provider("provider2")
-    assert router.default_provider is provider2
-
-
-def test_router_set_default_provider_not_registered() -> None:
-    """Test setting non-registered default provider raises error."""
-    router = LLMRouter[StructuredResponse]()
-    with pytest.raises(ProviderNotConfiguredError):
-        router.set_default_provider("nonexistent")
+@pytest.fixture
+def configured_router(make_mock_provider: MockProviderFactory) -> StructuredRouter:
+    router = StructuredRouter(default_provider_name="mock")
+    router.register_provider("mock", make_mock_provider(), {})
+    router.register_provider("other", make_mock_provider("model2"), {})
+    return router
 
 
 # --- Router Health Check Tests ---
 
+@pytest.mark.parametrize(
+    ("health_spec", "expected"),
+    [
+        ({"healthy": (True, "OK"), "unhealthy": (False, "Error")}, {"healthy": True, "unhealthy": False}),
+        ({"first": (True, "OK"), "second": (True, "OK")}, {"first": True, "second": True}),
+    ],
+    ids=["mixed", "all_healthy"],
+)
 @pytest.mark.asyncio
-async def test_router_health_check_all() -> None:
+async def test_router_health_check_all(
+    make_mock_provider: MockProviderFactory,
+    health_spec: dict[str, tuple[bool, str]],
+    expected: dict[str, bool],
+) -> None:
     """Test health check for all providers."""
-    router = LLMRouter[StructuredResponse]()
-    provider1 = MockProvider()
-    provider2 = MockProvider()
-    provider1.set_health(True, "OK")
-    provider2.set_health(False, "Error")
-    router.register_provider("healthy", provider1, {})
-    router.register_provider("unhealthy", provider2, {})
+    router = StructuredRouter()
+    for name, (healthy, message) in health_spec.items():
+        router.register_provider(name, make_mock_provider(healthy=healthy, message=message), {})
 
     results = await router.health_check_all()
+    assert {name: result.healthy for name, result in results.items()} == expected
+
+
+@pytest.mark.asyncio
+async def test_router_health_check_all_maps_exceptions(make_mock_provider: MockProviderFactory) -> None:
+    """Test that a raising provider does not abort the concurrent health checks."""
+
+    class FailingProvider(MockProvider):
+        async def health_check(self) -> HealthCheckResponse:
+            raise RuntimeError("boom")
+
+    router = StructuredRouter()
+    router.register_provider("failing", FailingProvider(), {})
+    router.register_provider("healthy", make_mock_provider(), {})
+
+    results = await router.health_check_all()
+    assert list(results) == ["failing", "healthy"]
+    assert results["failing"].healthy is False
+    assert results["failing"].message == "error checking health: boom"
     assert results["healthy"].healthy is True
-    assert results["unhealthy"].healthy is False
+
+
+@pytest.mark.asyncio
+async def test_router_health_check_all_propagates_cancellation(make_mock_provider: MockProviderFactory) -> None:
+    """Test that a cancelled provider check is re-raised, not reported as a health response."""
+
+    class CancelledProvider(MockProvider):
+        async def health_check(self) -> HealthCheckResponse:
+            raise asyncio.CancelledError()
+
+    router = StructuredRouter()
+    router.register_provider("cancelled", CancelledProvider(), {})
+    router.register_provider("healthy", make_mock_provider(), {})
+
+    with pytest.raises(asyncio.CancelledError):
+        await router.health_check_all()
 
 
 # --- Router Completion Tests ---
 
+@pytest.mark.parametrize(
+    ("provider_name", "expected_substr"),
+    [(None, "Mock response from mock-model"), ("other", "model2")],
+    ids=["default_provider", "specific_provider"],
+)
 @pytest.mark.asyncio
-async def test_router_complete_default_provider() -> None:
-    """Test completion using default provider."""
-    router = LLMRouter[StructuredResponse](default_provider_name="mock")
-    provider = MockProvider()
-    router.register_provider("mock", provider, {})
-
+async def test_router_complete(
+    configured_router: StructuredRouter, provider_name: str | None, expected_substr: str
+) -> None:
+    """Test completion routed to the default or a named provider."""
     request = LLMRequest(system_prompt="test", user_prompt="hello")
-    response = await router.complete(request)
-    assert "Mock response" in response.content
+    response = await configured_router.complete(request, provider_name=provider_name)
+    assert expected_substr in response.content
 
 
 @pytest.mark.asyncio
-async def test_router_complete_specific_provider() -> None:
-    """Test completion using specific provider."""
-    router = LLMRouter[StructuredResponse]()
-    provider1 = MockProvider("model1")
-    provider2 = MockProvider("model2")
-    router.register_provider("provider1", provider1, {})
-    router.register_provider("provider2", provider2, {})
-
-    request = LLMRequest(system_prompt="test", user_prompt="hello")
-    response = await router.complete(request, provider_name="provider2")
-    assert "model2" in response.content
+async def test_mock_provider_replays_identical_requests(make_mock_provider: MockProviderFactory) -> None:
+    """Test equal requests are served the same cached mock response."""
+    provider = make_mock_provider()
+    first = await provider.complete(LLMRequest(system_prompt="test", user_prompt="hello"))
+    again = await provider.complete(LLMRequest(system_prompt="test", user_prompt="hello"))
+    other = await provider.complete(LLMRequest(system_prompt="test", user_prompt="bye"))
+    assert again is first
+    assert other is not first
 
 
 @pytest.mark.asyncio
-async def test_router_complete_provider_not_configured() -> None:
+async def test_router_complete_provider_not_configured(
+    configured_router: StructuredRouter,
+) -> None:
     """Test completion with non-configured provider raises error."""
-    router = LLMRouter[StructuredResponse]()
     request = LLMRequest(system_prompt="test", user_prompt="hello")
     with pytest.raises(ProviderNotConfiguredError):
-        await router.complete(request, provider_name="nonexistent")
+        await configured_router.complete(request, provider_name="nonexistent")
 
 
+@pytest.mark.parametrize(
+    ("provider_name", "expected_substr"),
+    [(None, "Mock structured response from mock-model"), ("other", "model2")],
+    ids=["default_provider", "specific_provider"],
+)
 @pytest.mark.asyncio
-async def test_router_complete_structured() -> None:
-    """Test structured completion."""
-    router = LLMRouter[StructuredResponse](default_provider_name="mock")
-    provider = MockProvider()
-    router.register_provider("mock", provider, {})
-
+async def test_router_complete_structured(
+    configured_router: StructuredRouter, provider_name: str | None, expected_substr: str
+) -> None:
+    """Test structured completion routed to the default or a named provider."""
     request = LLMRequest(system_prompt="test", user_prompt="hello")
-    response = await router.complete_structured(request, StructuredResponse)
+    response = await configured_router.complete_structured(
+        request, StructuredResponse, provider_name=provider_name
+    )
     assert isinstance(response, StructuredResponse)
-    assert "Mock structured response" in response.content
+    assert expected_substr in response.content
 
 
 # --- Router Error Tests ---
@@ -189,7 +277,7 @@ def test_provider_not_configured_error_message() -> None:
 
 def test_router_from_config_uses_model_name_and_base_url() -> None:
     """Test provider construction from config with custom endpoints."""
-    router = LLMRouter[StructuredResponse].from_config(
+    router = StructuredRouter.from_config(
         {
             "default_provider": "openai",
             "providers": {
@@ -222,3 +310,259 @@ def test_router_from_config_uses_model_name_and_base_url() -> None:
     assert anthropic_provider.model == "proxy-anthropic-model"
     assert anthropic_provider._base_url == "https://anthropic.example.com"
     assert ollama_provider.model == "llama3"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("supports_prefix_cache", "expected_calls"), [(True, 1), (False, 0)])
+async def test_router_warmup_primes_only_prefix_caching_providers(
+    supports_prefix_cache: bool, expected_calls: int
+) -> None:
+    """Test that warmup forwards the shared system prompt only where it is cached."""
+
+    class RecordingProvider(MockProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            self.requests: list[LLMRequest] = []
+
+        async def complete(self, request: LLMRequest) -> LLMResponse:
+            self.requests.append(request)
+            return await super().complete(request)
+
+    router = StructuredRouter(default_provider_name="mock")
+    provider = RecordingProvider()
+    provider.supports_prefix_cache = supports_prefix_cache
+    router.register_provider("mock", provider, {})
+
+    await router.warmup("shared system prompt")
+
+    assert len(provider.requests) == expected_calls
+    for request in provider.requests:
+        assert request.system_prompt == "shared system prompt"
+        assert request.max_tokens == 1
+
+
+# --- Router Batch Tests ---
+
+@pytest.mark.asyncio
+async def test_router_complete_many_preserves_order_and_bounds_concurrency() -> None:
+    """Test batch completion ordering, in-band errors, and the concurrency cap."""
+
+    class TrackingProvider(MockProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            self.active = 0
+            self.peak = 0
+
+        async def complete(self, request: LLMRequest) -> LLMResponse:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0)
+            self.active -= 1
+            if request.user_prompt == "bad":
+                raise ProviderError("bad request")
+            return LLMResponse(content=request.user_prompt, model=self._model)
+
+    router = StructuredRouter(default_provider_name="mock")
+    provider = TrackingProvider()
+    router.register_provider("mock", provider, {})
+    prompts = ["a", "bad", "c", "d", "e"]
+
+    results = await router.complete_many(
+        [LLMRequest(system_prompt="s", user_prompt=p) for p in prompts], max_concurrent=2
+    )
+
+    assert [r.content if isinstance(r, LLMResponse) else "error" for r in results] == [
+        "a", "error", "c", "d", "e"
+    ]
+    assert isinstance(results[1], ProviderError)
+    assert provider.peak == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("batchable", "batch_error", "expected_batches", "expected_singles"),
+    [(True, None, 1, 0), (True, ProviderError("batch down"), 1, 0), (False, None, 0, 3)],
+    ids=["native_batch", "batch_failure_in_every_slot", "can_batch_false_fallback"],
+)
+async def test_router_complete_many_batch_branch(
+    batchable: bool, batch_error: Exception | None, expected_batches: int, expected_singles: int
+) -> None:
+    """Test that complete_many uses the provider's native batch call only when it can batch."""
+
+    class BatchingProvider(MockProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batch_calls = 0
+            self.single_calls = 0
+
+        def can_batch(self, requests: list[LLMRequest]) -> bool:
+            return batchable
+
+        async def complete_batch(self, requests: list[LLMRequest]) -> list[LLMResponse]:
+            self.batch_calls += 1
+            if batch_error is not None:
+                raise batch_error
+            return [LLMResponse(content=f"batched {r.user_prompt}", model=self._model) for r in requests]
+
+        async def complete(self, request: LLMRequest) -> LLMResponse:
+            self.single_calls += 1
+            return LLMResponse(content=f"single {request.user_prompt}", model=self._model)
+
+    router = StructuredRouter(default_provider_name="mock")
+    provider = BatchingProvider()
+    router.register_provider("mock", provider, {})
+    requests = [LLMRequest(system_prompt="s", user_prompt=p) for p in ("a", "b", "c")]
+
+    results = await router.complete_many(requests)
+
+    assert (provider.batch_calls, provider.single_calls) == (expected_batches, expected_singles)
+    if batch_error is not None:
+        assert results == [batch_error] * 3
+    else:
+        prefix = "batched" if batchable else "single"
+        assert [r.content for r in results] == [f"{prefix} {p}" for p in ("a", "b", "c")]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrent", [0, -1])
+@pytest.mark.parametrize("structured", [False, True], ids=["complete_many", "complete_structured_many"])
+async def test_router_many_rejects_non_positive_concurrency(
+    make_mock_provider: MockProviderFactory, max_concurrent: int, structured: bool
+) -> None:
+    """Test that a concurrency cap below one fails fast instead of hanging."""
+    router = StructuredRouter(default_provider_name="mock")
+    router.register_provider("mock", make_mock_provider(), {})
+    requests = [LLMRequest(system_prompt="s", user_prompt="u")]
+
+    with pytest.raises(ValueError, match="max_concurrent must be >= 1"):
+        if structured:
+            await router.complete_structured_many(requests, StructuredResponse, max_concurrent=max_concurrent)
+        else:
+            await router.complete_many(requests, max_concurrent=max_concurrent)
+
+
+@pytest.mark.asyncio
+async def test_router_complete_structured_many(make_mock_provider: MockProviderFactory) -> None:
+    """Test batch structured completion returns one typed response per request."""
+    router = StructuredRouter(default_provider_name="mock")
+    router.register_provider("mock", make_mock_provider(), {})
+
+    results = await router.complete_structured_many(
+        [LLMRequest(system_prompt="s", user_prompt="u")] * 3, StructuredResponse
+    )
+
+    assert len(results) == 3
+    assert all(isinstance(r, StructuredResponse) for r in results)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("temperature", "expected_calls"),
+    [(0.0, 2), (0.7, 3)],
+    ids=["deterministic_coalesced", "sampled_independent"],
+)
+async def test_router_coalesces_only_deterministic_requests(temperature: float, expected_calls: int) -> None:
+    """Test that identical in-flight requests share one call only at temperature 0."""
+
+    class CountingProvider(MockProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = 0
+
+        async def complete(self, request: LLMRequest) -> LLMResponse:
+            self.calls += 1
+            await asyncio.sleep(0)
+            return LLMResponse(content=request.user_prompt, model=self._model)
+
+    # Disable the cache so only in-flight coalescing is exercised.
+    router = StructuredRouter(default_provider_name="mock", max_cache_size=0)
+    provider = CountingProvider()
+    router.register_provider("mock", provider, {})
+    same = LLMRequest(system_prompt="s", user_prompt="same", temperature=temperature)
+    other = LLMRequest(system_prompt="s", user_prompt="other", temperature=temperature)
+
+    results = await router.complete_many([same, same, other])
+    assert [r.content for r in results] == ["same", "same", "other"]
+    assert provider.calls == expected_calls
+
+    await router.complete(same)
+    assert provider.calls == expected_calls + 1
+
+
+@pytest.mark.asyncio
+async def test_router_caches_deterministic_requests_with_lru_eviction() -> None:
+    """Test that temperature-0 responses are cached per request and evicted LRU-first."""
+
+    class CountingProvider(MockProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = 0
+
+        async def complete(self, request: LLMRequest) -> LLMResponse:
+            self.calls += 1
+            return LLMResponse(content=request.user_prompt, model=self._model)
+
+    router = StructuredRouter(default_provider_name="mock", max_cache_size=2)
+    provider = CountingProvider()
+    router.register_provider("mock", provider, {})
+    a, b, c = (LLMRequest(system_prompt="s", user_prompt=p, temperature=0.0) for p in "abc")
+
+    first = await router.complete(a)
+    assert await router.complete(a) == first
+    await router.complete(b)
+    await router.complete(c)  # evicts a
+    await router.complete(a)
+    assert provider.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_router_cache_hits_do_not_share_mutable_containers() -> None:
+    """Test that mutating a cached response's usage does not leak into later hits."""
+
+    class UsageProvider(MockProvider):
+        async def complete(self, request: LLMRequest) -> LLMResponse:
+            return LLMResponse(content="ok", model=self._model, usage={"total_tokens": 3})
+
+    router = StructuredRouter(default_provider_name="mock")
+    router.register_provider("mock", UsageProvider(), {})
+    request = LLMRequest(system_prompt="s", user_prompt="u", temperature=0.0)
+
+    first = await router.complete(request)
+    first.usage["total_tokens"] = 99
+    second = await router.complete(request)
+
+    assert second is not first
+    assert second.usage == {"total_tokens": 3}
+
+
+@pytest.mark.asyncio
+async def test_router_never_caches_sampled_requests() -> None:
+    """Test that temperature > 0 requests always reach the provider and stay out of the cache."""
+
+    class CountingProvider(MockProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = 0
+
+        async def complete(self, request: LLMRequest) -> LLMResponse:
+            self.calls += 1
+            return LLMResponse(content=f"sample {self.calls}", model=self._model)
+
+    router = StructuredRouter(default_provider_name="mock")
+    provider = CountingProvider()
+    router.register_provider("mock", provider, {})
+    sampled = LLMRequest(system_prompt="s", user_prompt="a", temperature=0.7)
+
+    first = await router.complete(sampled)
+    second = await router.complete(sampled)
+
+    assert provider.calls == 2
+    assert (first.content, second.content) == ("sample 1", "sample 2")
+    assert not router._cache
+
+
+def test_router_rejects_negative_cache_size() -> None:
+    """Test that a negative cache size is rejected rather than silently disabling the cache."""
+    with pytest.raises(ValueError, match="max_cache_size must be >= 0"):
+        StructuredRouter(max_cache_size=-1)
+
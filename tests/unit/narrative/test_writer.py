@@ -2,16 +2,24 @@ from __future__ import annotations
 
 import pytest
 
+from narrator.llm import ProviderError
 from narrator.narrative import NarrativeBeat, NarrativeWriter, NarrativeWriterError, render_rule_entry
 
 
 class FakeNarrativeClient:
-    def __init__(self, response_payload: dict[str, object]) -> None:
+    def __init__(self, response_payload: dict[str, object], warmup_error: Exception | None = None) -> None:
         self._response_payload = response_payload
+        self._warmup_error = warmup_error
+        self.warmups: list[tuple[str, str | None]] = []
 
     async def complete_structured(self, request, response_type, provider_name=None):
         return response_type.model_validate(self._response_payload)
 
+    async def warmup(self, system_prompt, provider_name=None):
+        self.warmups.append((system_prompt, provider_name))
+        if self._warmup_error is not None:
+            raise self._warmup_error
+
 
 def build_beat() -> NarrativeBeat:
     return NarrativeBeat(
@@ -53,3 +61,27 @@ async def test_narrative_writer_rejects_unknown_mentions() -> None:
 
     with pytest.raises(NarrativeWriterError, match="unknown character references"):
         await writer.write(beat)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("warmup_error", [None, ProviderError("warmup failed")], ids=["ok", "fails"])
+async def test_narrative_writer_warmup_forwards_and_never_aborts(warmup_error: Exception | None) -> None:
+    beat = build_beat()
+    client = FakeNarrativeClient(
+        {
+            "title": beat.title,
+            "summary_text": "市场上的账本被藏起，局势仍未落定。",
+            "mentioned_character_ids": ["merchant"],
+            "mentioned_event_ids": ["alarm-3"],
+        },
+        warmup_error=warmup_error,
+    )
+    writer = NarrativeWriter(client, provider_name="ollama")
+
+    await writer.warmup()
+    entry = await writer.write(beat)
+
+    assert len(client.warmups) == 1
+    assert client.warmups[0][1] == "ollama"
+    assert client.warmups[0][0]
+    assert entry.mentioned_character_ids == ("merchant",)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from narrator.core import RuleContext, RuleEngine, UnresolvedEventPressureRule
+from collections.abc import Callable
+
+from narrator.core import RuleContext, RuleEngine, RuleEngineResult, UnresolvedEventPressureRule
 from narrator.models import Action, ActionResult, Character, Granularity, StateMode, Verdict, WorldState
 from narrator.models.event import Event
 from narrator.orchestrator.event_pool import EventPoolSnapshot
@@ -20,6 +22,28 @@ class StaticRule:
         return ()
 
 
+_WORLD = WorldState(
+    tick=1,
+    seed=13,
+    granularity=Granularity.DAY,
+    characters={
+        "hero": Character(
+            id="hero",
+            name="Hero",
+            state_mode=StateMode.ACTIVE,
+            location_id="town",
+        )
+    },
+    events={
+        "alarm-1": Event(
+            id="alarm-1",
+            tick_created=1,
+            impact_scope={"location_id": "town", "target_character_id": "hero"},
+        )
+    },
+)
+
+
 def test_apply_world_rules_stage_projects_state_changes_and_audit() -> None:
     world = _build_world()
     engine = RuleEngine()
@@ -79,37 +103,17 @@ def test_apply_world_rules_stage_keeps_empty_stage_for_unmatched_rules() -> None
     assert stage.artifact_ids == ("static",)
 
 
-def test_unresolved_event_pressure_rule_is_deterministic() -> None:
+def test_unresolved_event_pressure_rule_is_deterministic(result_fingerprint: Callable[[RuleEngineResult], str]) -> None:
     engine = RuleEngine()
     engine.register(UnresolvedEventPressureRule())
     world = _build_world()
     context = RuleContext(tick=1, seed=13)
 
-    assert engine.settle(world, context) == engine.settle(world, context)
+    assert result_fingerprint(engine.settle(world, context)) == result_fingerprint(engine.settle(world, context))
 
 
 def _build_world(resources: dict[str, float] | None = None) -> WorldState:
-    return WorldState(
-        tick=1,
-        seed=13,
-        granularity=Granularity.DAY,
-        characters={
-            "hero": Character(
-                id="hero",
-                name="Hero",
-                state_mode=StateMode.ACTIVE,
-                location_id="town",
-            )
-        },
-        events={
-            "alarm-1": Event(
-                id="alarm-1",
-                tick_created=1,
-                impact_scope={"location_id": "town", "target_character_id": "hero"},
-            )
-        },
-        resources=resources or {},
-    )
+    return _WORLD.model_copy(update={"resources": resources}) if resources else _WORLD
 
 
 def _assignments() -> SpotlightAssignments:
@@ -4,30 +4,37 @@ from narrator.models import Character, Granularity, StateMode, WorldState
 from narrator.phenology import apply_phenology
 
 
+_CHARACTER = Character(
+    id="c-1",
+    name="Alice",
+    state_mode=StateMode.ACTIVE,
+    location_id="loc-1",
+)
+_WORLD = WorldState(
+    tick=0,
+    seed=2026,
+    granularity=Granularity.DAY,
+    characters={"c-1": _CHARACTER},
+    resources={
+        "military_readiness": 100.0,
+        "disease_pressure": 5.0,
+        "grain_stock": 80.0,
+    },
+    flags={"poor_harvest": False},
+)
+
+
 def _build_world(
     *,
     long_action: str | None = None,
     poor_harvest: bool = False,
 ) -> WorldState:
-    character = Character(
-        id="c-1",
-        name="Alice",
-        state_mode=StateMode.ACTIVE,
-        location_id="loc-1",
-        long_action=long_action,
-    )
-    return WorldState(
-        tick=0,
-        seed=2026,
-        granularity=Granularity.DAY,
-        characters={"c-1": character},
-        resources={
-            "military_readiness": 100.0,
-            "disease_pressure": 5.0,
-            "grain_stock": 80.0,
-        },
-        flags={"poor_harvest": poor_harvest},
-    )
+    update: dict[str, object] = {}
+    if long_action is not None:
+        update["characters"] = {"c-1": _CHARACTER.model_copy(update={"long_action": long_action})}
+    if poor_harvest:
+        update["flags"] = {"poor_harvest": True}
+    return _WORLD.model_copy(update=update) if update else _WORLD
 
 
 def test_winter_march_penalty_updates_numeric_state() -> None:
@@ -1,59 +1,127 @@
 from __future__ import annotations
 
+import copy
+import re
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
+from typing import Any
 
 import pytest
+import yaml
 from pydantic import ValidationError
 
-from narrator.config import ConfigLoadError, load_config
-
-
-def _write_config(path: Path, content: str) -> Path:
-    config_path = path / "config.yaml"
-    config_path.write_text(content, encoding="utf-8")
-    return config_path
-
-
-def _write_env(path: Path, content: str) -> Path:
-    env_path = path / ".env"
-    env_path.write_text(content, encoding="utf-8")
-    return env_path
-
-
-def test_load_config_with_env_substitution(tmp_path: Path) -> None:
-    config_path = _write_config(
-        tmp_path,
-        """
-simulation: {tick_unit_hours: 1, max_ticks: 10000, checkpoint_interval: 100}
-narrator: {max_retry: 3, instant_mode_max_rounds: 3}
-spotlight:
-  weights: {geo: 0.3, relation: 0.2, availability: 0.15, narrative_importance: 0.25, random_noise: 0.1}
-  threshold_active: 0.7
-  threshold_passive: 0.3
-phenology: {enabled_effects: [winter_march_penalty]}
-llm:
-  default_provider: "${LLM_DEFAULT_PROVIDER}"
-  providers:
-    openai: {model_name: "${OPENAI_MODEL_NAME}", api_key: "${OPENAI_API_KEY}", base_url: "${OPENAI_BASE_URL}", max_tokens: 2048}
-    anthropic: {model_name: "${ANTHROPIC_MODEL_NAME}", api_key: "${ANTHROPIC_API_KEY}", base_url: "${ANTHROPIC_BASE_URL}"}
-    ollama: {model_name: llama3, base_url: http://localhost:11434}
-persistence: {db_path: data/narrator.db, enable_wal: true}
-""",
-    )
-    env_path = _write_env(
-        tmp_path,
-        """
-OPENAI_API_KEY=openai-secret
-OPENAI_BASE_URL=https://openai.example.com/v1
-OPENAI_MODEL_NAME=third-party-openai-model
-ANTHROPIC_API_KEY=anthropic-secret
-ANTHROPIC_BASE_URL=https://anthropic.example.com
-ANTHROPIC_MODEL_NAME=third-party-anthropic-model
-LLM_DEFAULT_PROVIDER=anthropic
-""",
-    )
-
-    app_config = load_config(config_path, env_path)
+from narrator import config as config_module
+from narrator.config import ConfigLoadError, SpotlightWeights, clear_config_cache, load_config
+from narrator.file_cache import MAX_CACHED_FILES
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # libyaml bindings unavailable
+    from yaml import SafeDumper as _YamlDumper
+
+BASE_CONFIG: dict[str, Any] = {
+    "simulation": {"tick_unit_hours": 1, "max_ticks": 10000, "checkpoint_interval": 100},
+    "narrator": {"max_retry": 3, "instant_mode_max_rounds": 3},
+    "spotlight": {
+        "weights": {
+            "geo": 0.3,
+            "relation": 0.2,
+            "availability": 0.15,
+            "narrative_importance": 0.25,
+            "random_noise": 0.1,
+        },
+        "threshold_active": 0.7,
+        "threshold_passive": 0.3,
+    },
+    "phenology": {"enabled_effects": ["winter_march_penalty"]},
+    "llm": {
+        "default_provider": "${LLM_DEFAULT_PROVIDER}",
+        "providers": {
+            "openai": {
+                "model_name": "${OPENAI_MODEL_NAME}",
+                "api_key": "${OPENAI_API_KEY}",
+                "base_url": "${OPENAI_BASE_URL}",
+                "max_tokens": 2048,
+            },
+            "anthropic": {
+                "model_name": "${ANTHROPIC_MODEL_NAME}",
+                "api_key": "${ANTHROPIC_API_KEY}",
+                "base_url": "${ANTHROPIC_BASE_URL}",
+            },
+            "ollama": {"model_name": "llama3", "base_url": "http://localhost:11434"},
+        },
+    },
+    "persistence": {"db_path": "data/narrator.db", "enable_wal": True},
+}
+
+BASE_ENV: dict[str, str] = {
+    "OPENAI_API_KEY": "openai-secret",
+    "OPENAI_BASE_URL": "https://openai.example.com/v1",
+    "OPENAI_MODEL_NAME": "third-party-openai-model",
+    "ANTHROPIC_API_KEY": "anthropic-secret",
+    "ANTHROPIC_BASE_URL": "https://anthropic.example.com",
+    "ANTHROPIC_MODEL_NAME": "third-party-anthropic-model",
+    "LLM_DEFAULT_PROVIDER": "openai",
+}
+
+BASE_CONFIG_YAML = yaml.dump(BASE_CONFIG, Dumper=_YamlDumper, sort_keys=False)
+
+ConfigWriter = Callable[..., Path]
+
+
+def _apply_overrides(
+    config: dict[str, Any], overrides: Mapping[str, Any] | None, remove_keys: Iterable[str]
+) -> dict[str, Any]:
+    for dotted_key, value in (overrides or {}).items():
+        *parents, leaf = dotted_key.split(".")
+        target = config
+        for part in parents:
+            target = target[part]
+        target[leaf] = value
+    for dotted_key in remove_keys:
+        *parents, leaf = dotted_key.split(".")
+        target = config
+        for part in parents:
+            target = target[part]
+        del target[leaf]
+    return config
+
+
+@pytest.fixture
+def write_config(tmp_path: Path) -> ConfigWriter:
+    def _write(
+        overrides: Mapping[str, Any] | None = None,
+        remove_keys: Iterable[str] = (),
+        directory: Path = tmp_path,
+    ) -> Path:
+        config_path = directory / "config.yaml"
+        if not overrides and not remove_keys:
+            config_path.write_text(BASE_CONFIG_YAML, encoding="utf-8")
+            return config_path
+        config = _apply_overrides(copy.deepcopy(BASE_CONFIG), overrides, remove_keys)
+        config_path.write_text(yaml.dump(config, Dumper=_YamlDumper, sort_keys=False), encoding="utf-8")
+        return config_path
+
+    return _write
+
+
+@pytest.fixture
+def write_env(tmp_path: Path) -> ConfigWriter:
+    def _write(
+        overrides: Mapping[str, str] | None = None,
+        remove_keys: Iterable[str] = (),
+        directory: Path = tmp_path,
+    ) -> Path:
+        env = _apply_overrides(dict(BASE_ENV), overrides, remove_keys)
+        env_path = directory / ".env"
+        env_path.write_text("".join(f"{key}={value}\n" for key, value in env.items()), encoding="utf-8")
+        return env_path
+
+    return _write
+
+
+def test_load_config_with_env_substitution(write_config: ConfigWriter, write_env: ConfigWriter) -> None:
+    app_config = load_config(write_config(), write_env({"LLM_DEFAULT_PROVIDER": "anthropic"}))
     assert app_config.llm.providers.openai.api_key == "openai-secret"
     assert app_config.llm.providers.anthropic.api_key == "anthropic-secret"
     assert app_config.llm.default_provider == "anthropic"
@@ -63,118 +131,179 @@ LLM_DEFAULT_PROVIDER=anthropic
     assert app_config.llm.providers.anthropic.model_name == "third-party-anthropic-model"
 
 
-def test_load_config_missing_required_field_raises(tmp_path: Path) -> None:
-    config_path = _write_config(
-        tmp_path,
-        """
-narrator: {max_retry: 3, instant_mode_max_rounds: 3}
-spotlight:
-  weights: {geo: 0.3, relation: 0.2, availability: 0.15, narrative_importance: 0.25, random_noise: 0.1}
-  threshold_active: 0.7
-  threshold_passive: 0.3
-phenology: {enabled_effects: [winter_march_penalty]}
-llm:
-  default_provider: "${LLM_DEFAULT_PROVIDER}"
-  providers:
-    openai: {model_name: "${OPENAI_MODEL_NAME}", api_key: "${OPENAI_API_KEY}", base_url: "${OPENAI_BASE_URL}", max_tokens: 2048}
-    anthropic: {model_name: "${ANTHROPIC_MODEL_NAME}", api_key: "${ANTHROPIC_API_KEY}", base_url: "${ANTHROPIC_BASE_URL}"}
-    ollama: {model_name: llama3, base_url: http://localhost:11434}
-persistence: {db_path: data/narrator.db, enable_wal: true}
-""",
-    )
-    env_path = _write_env(
-        tmp_path,
-        """
-OPENAI_API_KEY=openai-secret
-OPENAI_BASE_URL=https://openai.example.com/v1
-OPENAI_MODEL_NAME=third-party-openai-model
-ANTHROPIC_API_KEY=anthropic-secret
-ANTHROPIC_BASE_URL=https://anthropic.example.com
-ANTHROPIC_MODEL_NAME=third-party-anthropic-model
-LLM_DEFAULT_PROVIDER=openai
-""",
-    )
+@pytest.mark.parametrize(
+    ("config_overrides", "config_removed", "env_removed", "expected_error", "expects_validation_cause"),
+    [
+        (None, ("simulation",), (), "config validation failed", True),
+        ({"simulation.max_ticks": "bad"}, (), (), "config validation failed", True),
+        (None, (), ("OPENAI_API_KEY",), "missing environment variable: OPENAI_API_KEY", False),
+    ],
+    ids=["missing_required_field", "type_error", "missing_env_var"],
+)
+def test_load_config_rejects_invalid_input(
+    write_config: ConfigWriter,
+    write_env: ConfigWriter,
+    config_overrides: dict[str, Any] | None,
+    config_removed: tuple[str, ...],
+    env_removed: tuple[str, ...],
+    expected_error: str,
+    expects_validation_cause: bool,
+) -> None:
+    config_path = write_config(config_overrides, config_removed)
+    env_path = write_env(remove_keys=env_removed)
 
     with pytest.raises(ConfigLoadError) as exc_info:
         load_config(config_path, env_path)
 
-    assert "config validation failed" in str(exc_info.value)
-    assert isinstance(exc_info.value.__cause__, ValidationError)
-
-
-def test_load_config_type_error_raises(tmp_path: Path) -> None:
-    config_path = _write_config(
-        tmp_path,
-        """
-simulation: {tick_unit_hours: 1, max_ticks: bad, checkpoint_interval: 100}
-narrator: {max_retry: 3, instant_mode_max_rounds: 3}
-spotlight:
-  weights: {geo: 0.3, relation: 0.2, availability: 0.15, narrative_importance: 0.25, random_noise: 0.1}
-  threshold_active: 0.7
-  threshold_passive: 0.3
-phenology: {enabled_effects: [winter_march_penalty]}
-llm:
-  default_provider: "${LLM_DEFAULT_PROVIDER}"
-  providers:
-    openai: {model_name: "${OPENAI_MODEL_NAME}", api_key: "${OPENAI_API_KEY}", base_url: "${OPENAI_BASE_URL}", max_tokens: 2048}
-    anthropic: {model_name: "${ANTHROPIC_MODEL_NAME}", api_key: "${ANTHROPIC_API_KEY}", base_url: "${ANTHROPIC_BASE_URL}"}
-    ollama: {model_name: llama3, base_url: http://localhost:11434}
-persistence: {db_path: data/narrator.db, enable_wal: true}
-""",
-    )
-    env_path = _write_env(
-        tmp_path,
-        """
-OPENAI_API_KEY=openai-secret
-OPENAI_BASE_URL=https://openai.example.com/v1
-OPENAI_MODEL_NAME=third-party-openai-model
-ANTHROPIC_API_KEY=anthropic-secret
-ANTHROPIC_BASE_URL=https://anthropic.example.com
-ANTHROPIC_MODEL_NAME=third-party-anthropic-model
-LLM_DEFAULT_PROVIDER=openai
-""",
-    )
+    assert expected_error in str(exc_info.value)
+    assert isinstance(exc_info.value.__cause__, ValidationError) is expects_validation_cause
 
-    with pytest.raises(ConfigLoadError) as exc_info:
-        load_config(config_path, env_path)
 
-    assert "config validation failed" in str(exc_info.value)
-    assert isinstance(exc_info.value.__cause__, ValidationError)
-
-
-def test_load_config_missing_env_var_raises(tmp_path: Path) -> None:
-    config_path = _write_config(
-        tmp_path,
-        """
-simulation: {tick_unit_hours: 1, max_ticks: 10000, checkpoint_interval: 100}
-narrator: {max_retry: 3, instant_mode_max_rounds: 3}
-spotlight:
-  weights: {geo: 0.3, relation: 0.2, availability: 0.15, narrative_importance: 0.25, random_noise: 0.1}
-  threshold_active: 0.7
-  threshold_passive: 0.3
-phenology: {enabled_effects: [winter_march_penalty]}
-llm:
-  default_provider: "${LLM_DEFAULT_PROVIDER}"
-  providers:
-    openai: {model_name: "${OPENAI_MODEL_NAME}", api_key: "${OPENAI_API_KEY}", base_url: "${OPENAI_BASE_URL}", max_tokens: 2048}
-    anthropic: {model_name: "${ANTHROPIC_MODEL_NAME}", api_key: "${ANTHROPIC_API_KEY}", base_url: "${ANTHROPIC_BASE_URL}"}
-    ollama: {model_name: llama3, base_url: http://localhost:11434}
-persistence: {db_path: data/narrator.db, enable_wal: true}
-""",
-    )
-    env_path = _write_env(
-        tmp_path,
-        """
-OPENAI_MODEL_NAME=third-party-openai-model
-OPENAI_BASE_URL=https://openai.example.com/v1
-ANTHROPIC_API_KEY=anthropic-secret
-ANTHROPIC_BASE_URL=https://anthropic.example.com
-ANTHROPIC_MODEL_NAME=third-party-anthropic-model
-LLM_DEFAULT_PROVIDER=openai
-""",
-    )
+def test_load_config_reuses_cached_instance_until_file_changes(
+    tmp_path: Path, write_config: ConfigWriter
+) -> None:
+    clear_config_cache()
+    literal_llm = {
+        "llm.default_provider": "openai",
+        "llm.providers.openai.model_name": "gpt",
+        "llm.providers.openai.base_url": "https://openai.example.com/v1",
+        "llm.providers.anthropic": {
+            "model_name": "claude",
+            "api_key": "anthropic-secret",
+            "base_url": "https://anthropic.example.com",
+        },
+    }
 
-    with pytest.raises(ConfigLoadError) as exc_info:
-        load_config(config_path, env_path)
+    def write_raw_env(content: str, directory: Path = tmp_path) -> Path:
+        env_path = directory / ".env"
+        env_path.write_text(content, encoding="utf-8")
+        return env_path
+
+    config_path = write_config(literal_llm)
+    env_path = write_raw_env("OPENAI_API_KEY=openai-secret\n")
+
+    first = load_config(config_path, env_path)
+    assert load_config(config_path, env_path) is first
+
+    write_raw_env("OPENAI_API_KEY=rotated-openai-secret\n")
+    rotated = load_config(config_path, env_path)
+    assert rotated is not first
+    assert rotated.llm.providers.openai.api_key == "rotated-openai-secret"
+
+    write_config({**literal_llm, "simulation.max_ticks": 500})
+    assert load_config(config_path, env_path).simulation.max_ticks == 500
+
+    copy_dir = tmp_path / "copy"
+    copy_dir.mkdir()
+    copy_env = write_raw_env("OPENAI_API_KEY=rotated-openai-secret\n", copy_dir)
+    copied = load_config(write_config(literal_llm, directory=copy_dir), copy_env)
+    assert copied == rotated
+    assert isinstance(copied.spotlight.weights, SpotlightWeights)
+
+
+def test_load_config_shares_an_immutable_instance(write_config: ConfigWriter, write_env: ConfigWriter) -> None:
+    clear_config_cache()
+    config_path, env_path = write_config(), write_env()
+    first = load_config(config_path, env_path)
+
+    assert load_config(config_path, env_path) is first
+    assert first.phenology.enabled_effects == ("winter_march_penalty",)
+    with pytest.raises(AttributeError):
+        first.phenology.enabled_effects.append("mutated")  # type: ignore[attr-defined]
+
+
+def test_load_config_cache_keeps_one_entry_per_path_and_is_bounded(
+    tmp_path: Path, write_config: ConfigWriter, write_env: ConfigWriter
+) -> None:
+    clear_config_cache()
+    env_path = write_env()
+    config_path = write_config()
+    load_config(config_path, env_path)
+    load_config(write_config({"simulation.max_ticks": 500}), env_path)
+    assert len(config_module._CONFIG_CACHE) == 1
+
+    for index in range(MAX_CACHED_FILES + 4):
+        directory = tmp_path / f"rotated-{index}"
+        directory.mkdir()
+        load_config(write_config({"simulation.max_ticks": index + 1}, directory=directory), env_path)
+    assert len(config_module._CONFIG_CACHE) == MAX_CACHED_FILES
+    assert len(config_module._YAML_CACHE) == MAX_CACHED_FILES
+    assert len(config_module._TRUSTED_PAYLOADS) == MAX_CACHED_FILES
+
+
+# The regex substitution that the str.find scanner replaced; kept as the parity oracle.
+_LEGACY_ENV_PATTERN = re.compile(r"\$\{([A-Z0-9_]+)\}")
+
+
+def _legacy_replace_env_tokens(value: str, env_values: dict[str, str]) -> str:
+    def replacement(match: re.Match[str]) -> str:
+        env_value = env_values.get(match.group(1))
+        if env_value is None:
+            raise ConfigLoadError(f"missing environment variable: {match.group(1)}")
+        return env_value
+
+    return _LEGACY_ENV_PATTERN.sub(replacement, value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "plain",
+        "${A}",
+        "${lower} ${A-B} ${A B}",
+        "prefix ${A",
+        "${}",
+        "${${A}}",
+        "$${A}",
+        "${A}-${B_2}/${A}",
+        "${A} at start",
+        "at end ${B_2}",
+        "${MISSING}",
+        "${lower} then ${MISSING}",
+    ],
+    ids=[
+        "no_token",
+        "single",
+        "invalid_names",
+        "unterminated",
+        "empty_name",
+        "nested",
+        "doubled_dollar",
+        "several",
+        "at_start",
+        "at_end",
+        "missing",
+        "missing_after_invalid",
+    ],
+)
+def test_replace_env_tokens_matches_legacy_regex(value: str) -> None:
+    env_values = {"A": "alpha", "B_2": "beta"}
+    try:
+        expected: str | Exception = _legacy_replace_env_tokens(value, env_values)
+    except ConfigLoadError as exc:
+        expected = exc
+
+    if isinstance(expected, ConfigLoadError):
+        with pytest.raises(ConfigLoadError, match=re.escape(str(expected))):
+            config_module._replace_env_tokens(value, env_values)
+    else:
+        assert config_module._replace_env_tokens(value, env_values) == expected
+
+
+def test_resolve_env_inplace_substitutes_inside_lists_and_nested_containers() -> None:
+    shared_leaf = {"key": "${A}"}
+    root: dict[str, Any] = {
+        "plain": "${B_2}",
+        "items": ["${A}", 3, None, "keep", ["${B_2}", {"deep": "x-${A}"}]],
+        "nested": {"inner": {"values": ["${A}/${B_2}"]}, "leaf": shared_leaf},
+    }
+
+    resolved = config_module._resolve_env_inplace(root, {"A": "alpha", "B_2": "beta"})
 
-    assert "missing environment variable: OPENAI_API_KEY" in str(exc_info.value)
+    assert resolved is root
+    assert root == {
+        "plain": "beta",
+        "items": ["alpha", 3, None, "keep", ["beta", {"deep": "x-alpha"}]],
+        "nested": {"inner": {"values": ["alpha/beta"]}, "leaf": {"key": "alpha"}},
+    }
+    assert root["nested"]["leaf"] is shared_leaf
@@ -1,47 +1,53 @@
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
-from pydantic import ValidationError
-
-from narrator.models import Action, ActionResult, Character, Granularity, StateMode, Verdict, WorldState
-
-
-def test_character_invalid_enum_rejected() -> None:
-    with pytest.raises(ValidationError):
-        Character(
-            id="c-1",
-            name="A",
-            state_mode="INVALID",
-            location_id="loc-1",
-        )
-
-
-def test_character_extra_field_rejected() -> None:
-    with pytest.raises(ValidationError):
-        Character(
-            id="c-1",
-            name="A",
-            state_mode=StateMode.ACTIVE,
-            location_id="loc-1",
-            unknown_field=True,
-        )
-
-
-def test_world_state_requires_matching_character_key() -> None:
-    with pytest.raises(ValidationError):
-        WorldState(
-            tick=0,
-            seed=123,
-            granularity=Granularity.DAY,
-            characters={
-                "key-x": Character(
-                    id="c-1",
-                    name="A",
-                    state_mode=StateMode.PASSIVE,
-                    location_id="loc-1",
-                ),
+from pydantic import BaseModel, ValidationError
+
+from narrator.models import Action, ActionResult, Character, Granularity, StateChange, StateMode, Verdict, WorldState
+from narrator.models.base import construct_trusted
+
+
+@pytest.mark.parametrize(
+    ("model_cls", "kwargs", "match"),
+    [
+        (Character, {"id": "c-1", "name": "A", "state_mode": "INVALID", "location_id": "loc-1"}, None),
+        (
+            Character,
+            {"id": "c-1", "name": "A", "state_mode": StateMode.ACTIVE, "location_id": "loc-1", "unknown_field": True},
+            None,
+        ),
+        (
+            WorldState,
+            {
+                "tick": 0,
+                "seed": 123,
+                "granularity": Granularity.DAY,
+                # The nested character is only the input under test, so skip its own validation.
+                "characters": {
+                    "key-x": Character.model_construct(
+                        id="c-1",
+                        name="A",
+                        state_mode=StateMode.PASSIVE,
+                        location_id="loc-1",
+                    ),
+                },
             },
-        )
+            "character key mismatch",
+        ),
+        (WorldState, {"tick": 0, "seed": 123, "facts": {"f-1": {"id": "f-2"}}}, "fact key mismatch"),
+        (
+            WorldState,
+            {"tick": 0, "seed": 123, "beliefs": {"c-1": ({"character_id": "c-2"},)}},
+            "belief key mismatch",
+        ),
+    ],
+    ids=["bad_enum", "extra_field", "character_key_mismatch", "fact_key_mismatch", "belief_key_mismatch"],
+)
+def test_model_rejects_invalid_payload(model_cls: type[BaseModel], kwargs: dict[str, Any], match: str | None) -> None:
+    with pytest.raises(ValidationError, match=match):
+        model_cls(**kwargs)
 
 
 def test_action_result_accepts_valid_contract() -> None:
@@ -54,3 +60,29 @@ def test_action_result_accepts_valid_contract() -> None:
         verdict=Verdict.APPROVED,
     )
     assert result.verdict == Verdict.APPROVED
+
+
+def test_construct_trusted_rebuilds_nested_models_from_dump() -> None:
+    result = ActionResult(
+        action=Action(character_id="c-1", action_type="rest", parameters={"duration_hours": 8}),
+        verdict=Verdict.APPROVED,
+        state_changes=(StateChange(path="resources.food", before=1, after=0, reason="eat"),),
+    )
+    rebuilt = construct_trusted(ActionResult, result.model_dump())
+    assert rebuilt == result
+    assert isinstance(rebuilt.action, Action)
+    assert isinstance(rebuilt.state_changes, tuple)
+    assert isinstance(rebuilt.state_changes[0], StateChange)
+
+
+def test_construct_trusted_copies_mutable_leaves() -> None:
+    payload = ActionResult(
+        action=Action(character_id="c-1", action_type="rest", parameters={"duration_hours": 8}),
+        verdict=Verdict.APPROVED,
+    ).model_dump()
+
+    rebuilt = construct_trusted(ActionResult, payload)
+    rebuilt.action.parameters["duration_hours"] = 1
+
+    assert payload["action"]["parameters"] == {"duration_hours": 8}
+    assert construct_trusted(ActionResult, payload).action.parameters == {"duration_hours": 8}